@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""report_generator.py 규모별 성능 벤치마크.
+
+합성 입력 JSON(행 수 10^3 ~ 10^6)을 만들어 보고서를 생성하고, 단계별 프로파일 결과를
+JSON Lines 파일에 누적 기록하여 버전 간 성능 추이를 비교할 수 있게 한다.
+최대 메모리는 프로세스 전체의 최고치이므로 규모마다 입력만 읽는 새 프로세스에서 측정한다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from report_generator import REPORT_FORMATS, parse_formats
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+REPORT_SCRIPT = Path(__file__).resolve().with_name("report_generator.py")
+
+
+def build_synthetic_data(rows: int, seed: int = 0) -> Dict[str, Any]:
+    """부처/월별 표에 각각 ``rows``개의 행을 가진 합성 보고서 데이터를 만든다."""
+    rng = random.Random(seed)
+    return {
+        "title": f"벤치마크 리포트 ({rows:,}행)",
+        "date": "2024-11-15",
+        "summary": {
+            "total_services": rng.randint(100, 1000),
+            "new_services": rng.randint(0, 100),
+            "improved_services": rng.randint(0, 100),
+            "user_satisfaction": round(rng.uniform(1, 5), 1),
+        },
+        "departments": [
+            {
+                "name": f"부서{index:07d}",
+                "services": rng.randint(1, 500),
+                "users": rng.randint(1_000, 10_000_000),
+                "satisfaction": round(rng.uniform(1, 5), 1),
+                "budget_used": round(rng.uniform(0, 100), 1),
+            }
+            for index in range(rows)
+        ],
+        "monthly_stats": [
+            {"month": f"{index // 12 + 2000}년 {index % 12 + 1}월", "users": rng.randint(1_000, 10_000_000), "services": rng.randint(1, 500)}
+            for index in range(rows)
+        ],
+        "issues": [f"이슈 {index}" for index in range(10)],
+        "next_steps": [f"조치 {index}" for index in range(10)],
+    }
+
+
+def run_benchmark(rows: int, formats: List[str], work_dir: Path, seed: int) -> Dict[str, Any]:
+    input_path = work_dir / f"input_{rows}.json"
+    with input_path.open("w", encoding="utf-8") as fh:
+        json.dump(build_synthetic_data(rows, seed), fh, ensure_ascii=False)
+
+    # 합성 데이터 생성이나 이전 규모의 메모리가 측정값에 섞이지 않도록 별도 프로세스에서 실행
+    profile_path = work_dir / f"profile_{rows}.json"
+    subprocess.run(
+        [
+            sys.executable,
+            str(REPORT_SCRIPT),
+            str(input_path),
+            "-o",
+            str(work_dir / f"bench_{rows}.html"),
+            "-f",
+            ",".join(formats),
+            "--profile",
+            str(profile_path),
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    with profile_path.open("r", encoding="utf-8") as fh:
+        report = json.load(fh)
+    report["rows"] = rows
+    report["input_bytes"] = input_path.stat().st_size
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="report_generator.py 규모별 성능 벤치마크")
+    parser.add_argument(
+        "-n",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="표당 행 수 목록 (기본값: 1000 10000 100000 1000000)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="formats",
+        type=parse_formats,
+        default=list(REPORT_FORMATS),
+        help="측정할 출력 형식 (기본값: all)",
+    )
+    parser.add_argument("-o", "--output", default="bench_results.jsonl", help="결과를 누적 기록할 JSON Lines 경로")
+    parser.add_argument("--label", default="", help="결과에 함께 기록할 버전/브랜치 이름")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+    parser.add_argument("--keep", metavar="DIR", help="생성한 입력/보고서를 보관할 폴더 (기본값: 임시 폴더 후 삭제)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    meta = {
+        "label": args.label,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "formats": args.formats,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(args.keep) if args.keep else Path(tmp)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "a", encoding="utf-8") as out:
+            for rows in args.sizes:
+                result = {**meta, **run_benchmark(rows, args.formats, work_dir, args.seed)}
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                out.flush()
+                print(
+                    f"{rows:>10,}행  {result['total_seconds']:8.3f}초  "
+                    f"최대 메모리 {result['peak_memory_bytes'] / 1_048_576:8.1f}MB"
+                )
+    print(f"벤치마크 결과가 기록되었습니다: {Path(args.output).resolve()}")
+
+
+if __name__ == "__main__":
+    main()
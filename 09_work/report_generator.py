@@ -1,13 +1,31 @@
 ﻿#!/usr/bin/env python3
-"""HTML 리포트 생성기."""
+"""리포트 생성기 (HTML/CSV/JSON/Markdown)."""
 from __future__ import annotations
 
 import argparse
+import csv
+import ctypes
+import ctypes.util
+import io
 import json
+import os
+import select
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext, suppress
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from html import escape
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+
+try:  # Windows에는 resource 모듈이 없음
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
 
 STYLE_BLOCK = """
 <style>
@@ -109,6 +127,135 @@ STYLE_BLOCK = """
 """
 
 
+REPORT_FORMATS = ("html", "csv", "json", "md")
+FORMAT_EXTENSIONS = {"html": ".html", "csv": ".csv", "json": ".json", "md": ".md"}
+
+# (키, 표시 이름, 단위, 소수점 자리수)
+SUMMARY_FIELDS = [
+    ("total_services", "총 서비스 수", "건", 0),
+    ("new_services", "신규 서비스", "건", 0),
+    ("improved_services", "개선 완료", "건", 0),
+    ("user_satisfaction", "평균 만족도", "점", 1),
+]
+SUMMARY_DECIMALS = {key: decimals for key, _, _, decimals in SUMMARY_FIELDS}
+
+# (키, 표 머리글, 소수점 자리수 - None이면 문자열 컬럼)
+DEPARTMENT_COLUMNS = [
+    ("name", "부서", None),
+    ("services", "제공 서비스", 0),
+    ("users", "이용자 수", 0),
+    ("satisfaction", "만족도", 1),
+    ("budget_used", "집행 예산(%)", 1),
+]
+MONTHLY_COLUMNS = [
+    ("month", "월", None),
+    ("users", "이용자 수", 0),
+    ("services", "서비스 수", 0),
+]
+
+
+@dataclass
+class ReportModel:
+    """모든 출력 형식이 공유하는 정규화된 보고서 데이터."""
+
+    title: str
+    date: str | None
+    date_label: str
+    doc_number: str
+    summary: List[Dict[str, Any]] = field(default_factory=list)
+    departments: List[Dict[str, Any]] = field(default_factory=list)
+    monthly_stats: List[Dict[str, Any]] = field(default_factory=list)
+    issues: List[str] = field(default_factory=list)
+    next_steps: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class NullProfiler:
+    """프로파일링을 끈 경우 사용하는 빈 측정기."""
+
+    def stage(self, name: str, fh: Any = None) -> ContextManager[None]:
+        return nullcontext()
+
+
+def tell_bytes(fh: Any) -> int | None:
+    # 텍스트 버퍼를 비운 뒤 하위 바이너리 스트림 위치로 실제 기록된 바이트 수를 얻는다
+    raw = getattr(fh, "buffer", None)
+    if raw is None:
+        return None
+    fh.flush()
+    return raw.tell()
+
+
+def peak_rss_bytes() -> int | None:
+    # Linux의 ru_maxrss는 fork/exec 전 부모 프로세스의 최고치를 물려받으므로 현재 주소 공간의 최고치(VmHWM)를 우선 사용
+    with suppress(OSError, ValueError):
+        with open("/proc/self/status", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위로 반환
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RenderProfiler:
+    """단계별 경과 시간, 출력 바이트 수, 최대 메모리를 기록한다.
+
+    최대 메모리는 프로세스 최대 RSS(단계 종료 시점까지의 최고치)이며, ``resource`` 모듈이
+    없는 Windows에서는 tracemalloc으로 측정한다(추적 비용만큼 시간이 늘어남).
+    """
+
+    def __init__(self) -> None:
+        self.stages: List[Dict[str, Any]] = []
+        self.outputs: List[Dict[str, Any]] = []
+        self.memory_source = "rss" if resource is not None else "tracemalloc"
+        if resource is None:
+            tracemalloc.start()
+        self._started = time.perf_counter()
+
+    def peak_memory(self) -> int | None:
+        if resource is not None:
+            return peak_rss_bytes()
+        return tracemalloc.get_traced_memory()[1]
+
+    @contextmanager
+    def stage(self, name: str, fh: Any = None) -> Iterator[None]:
+        start_bytes = tell_bytes(fh)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            entry: Dict[str, Any] = {"stage": name, "seconds": round(elapsed, 6), "peak_memory_bytes": self.peak_memory()}
+            if start_bytes is not None:
+                entry["bytes"] = tell_bytes(fh) - start_bytes
+            self.stages.append(entry)
+
+    def record_output(self, fmt: str, path: Path) -> None:
+        self.outputs.append({"format": fmt, "path": str(path), "bytes": path.stat().st_size})
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "total_seconds": round(time.perf_counter() - self._started, 6),
+            "peak_memory_bytes": self.peak_memory(),
+            "memory_source": self.memory_source,
+            "stages": self.stages,
+            "outputs": self.outputs,
+        }
+
+    def close(self) -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+Profiler = Union[RenderProfiler, NullProfiler]
+NULL_PROFILER = NullProfiler()
+
+
 def load_data(path: Path) -> Dict[str, Any]:
     # BOM이 포함된 파일도 읽을 수 있도록 utf-8-sig 사용
     with path.open("r", encoding="utf-8-sig") as fh:
@@ -126,6 +273,8 @@ def format_date(date_str: str | None) -> str:
 
 
 def format_number(value: Any, decimals: int = 0) -> str:
+    if value is None:
+        return "-"
     if isinstance(value, (int, float)):
         if decimals:
             return f"{value:,.{decimals}f}"
@@ -133,18 +282,51 @@ def format_number(value: Any, decimals: int = 0) -> str:
     return str(value)
 
 
-def build_summary_cards(summary: Dict[str, Any]) -> str:
-    mapping = [
-        ("총 서비스 수", summary.get("total_services"), "건"),
-        ("신규 서비스", summary.get("new_services"), "건"),
-        ("개선 완료", summary.get("improved_services"), "건"),
-        ("평균 만족도", summary.get("user_satisfaction"), "점"),
-    ]
+def format_cell(value: Any, decimals: int | None) -> str:
+    if decimals is None:
+        return "-" if value is None else str(value)
+    return format_number(value, decimals)
+
+
+def format_summary_value(item: Dict[str, Any]) -> str:
+    value = item.get("value")
+    if value is None:
+        return "-"
+    decimals = SUMMARY_DECIMALS.get(item.get("key", ""), 0)
+    return f"{format_number(value, decimals)} {item.get('unit', '')}".strip()
+
+
+def normalize_rows(rows: Iterable[Dict[str, Any]], columns: List[tuple]) -> List[Dict[str, Any]]:
+    # 누락된 키는 None으로 채워 모든 행이 같은 컬럼 구성을 갖도록 맞춤
+    return [{key: row.get(key) for key, _, _ in columns} for row in rows]
+
+
+def normalize_report(data: Dict[str, Any], now: datetime | None = None) -> ReportModel:
+    """원천 JSON을 한 번만 정규화하여 모든 렌더러가 재사용할 수 있게 한다."""
+    now = now or datetime.now()
+    summary = data.get("summary", {})
+    return ReportModel(
+        title=str(data.get("title", "데이터 리포트")),
+        date=data.get("date"),
+        date_label=format_date(data.get("date")),
+        doc_number="GOV-DS-" + now.strftime("%Y%m%d"),
+        summary=[
+            {"key": key, "label": label, "value": summary.get(key), "unit": unit}
+            for key, label, unit, _ in SUMMARY_FIELDS
+        ],
+        departments=normalize_rows(data.get("departments", []), DEPARTMENT_COLUMNS),
+        monthly_stats=normalize_rows(data.get("monthly_stats", []), MONTHLY_COLUMNS),
+        issues=[str(item) for item in data.get("issues", [])],
+        next_steps=[str(item) for item in data.get("next_steps", [])],
+    )
+
+
+def build_summary_cards(items: Iterable[Dict[str, Any]]) -> str:
     cards = []
-    for label, value, unit in mapping:
-        val = "-" if value is None else f"{format_number(value, 1 if label == '평균 만족도' else 0)} {unit}".strip()
+    for item in items:
+        val = format_summary_value(item)
         cards.append(
-            f"<div class=\"card\"><span class=\"label\">{escape(label)}</span><span class=\"value\">{escape(val)}</span></div>"
+            f"<div class=\"card\"><span class=\"label\">{escape(item['label'])}</span><span class=\"value\">{escape(val)}</span></div>"
         )
     return f"<div class=\"summary-grid\">{''.join(cards)}</div>"
 
@@ -167,11 +349,11 @@ def build_department_table(rows: Iterable[Dict[str, Any]]) -> str:
     for row in rows:
         body_rows.append(
             "<tr>"
-            f"<td>{escape(str(row.get('name', '-')))}</td>"
-            f"<td>{format_number(row.get('services', '-'))}</td>"
-            f"<td>{format_number(row.get('users', '-'))}</td>"
-            f"<td>{format_number(row.get('satisfaction', '-'), 1)}</td>"
-            f"<td>{format_number(row.get('budget_used', '-'), 1)}</td>"
+            f"<td>{escape(format_cell(row.get('name'), None))}</td>"
+            f"<td>{format_number(row.get('services'))}</td>"
+            f"<td>{format_number(row.get('users'))}</td>"
+            f"<td>{format_number(row.get('satisfaction'), 1)}</td>"
+            f"<td>{format_number(row.get('budget_used'), 1)}</td>"
             "</tr>"
         )
     footer = "</tbody></table>"
@@ -199,75 +381,73 @@ def build_monthly_table(rows: Iterable[Dict[str, Any]]) -> str:
     for row in rows:
         body_rows.append(
             "<tr>"
-            f"<td>{escape(str(row.get('month', '-')))}</td>"
-            f"<td>{format_number(row.get('users', '-'))}</td>"
-            f"<td>{format_number(row.get('services', '-'))}</td>"
+            f"<td>{escape(format_cell(row.get('month'), None))}</td>"
+            f"<td>{format_number(row.get('users'))}</td>"
+            f"<td>{format_number(row.get('services'))}</td>"
             "</tr>"
         )
     footer = "</tbody></table>"
     return header + "".join(body_rows) + footer
 
 
-def render_report(data: Dict[str, Any]) -> str:
-    title = escape(data.get("title", "데이터 리포트"))
-    date = format_date(data.get("date"))
-    summary_cards = build_summary_cards(data.get("summary", {}))
-    dept_table = build_department_table(data.get("departments", []))
-    monthly_table = build_monthly_table(data.get("monthly_stats", []))
-    monthly_json = json.dumps(data.get("monthly_stats", []), ensure_ascii=False)
-    issues = build_list(data.get("issues", []))
-    next_steps = build_list(data.get("next_steps", []))
-
-    parts: List[str] = []
-    parts.append("<!DOCTYPE html>")
-    parts.append("<html lang=\"ko\">")
-    parts.append("<head>")
-    parts.append("<meta charset=\"utf-8\">")
-    parts.append("<title>" + title + "</title>")
-    parts.append('<meta name="viewport" content="width=device-width, initial-scale=1">')
-    parts.append('<link rel="preconnect" href="https://fonts.gstatic.com">')
-    parts.append('<link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;600&display=swap" rel="stylesheet">')
-    parts.append(STYLE_BLOCK)
-    parts.append("</head>")
-    parts.append("<body>")
-    parts.append("<header>")
-    parts.append(f"<h1>{title}</h1>")
-    parts.append(f"<p>작성일: {escape(date)}</p>")
-    parts.append("<p>문서번호: GOV-DS-" + datetime.now().strftime("%Y%m%d") + "</p>")
-    parts.append("</header>")
-    parts.append("<main>")
-
-    parts.append("<section>")
-    parts.append("<h2>1. 핵심 지표 요약</h2>")
-    parts.append(summary_cards)
-    parts.append("</section>")
-
-    parts.append("<section>")
-    parts.append("<h2>2. 부처별 운영 현황</h2>")
-    parts.append(dept_table)
-    parts.append("</section>")
-
-    parts.append("<section>")
-    parts.append("<h2>3. 월별 이용 추이</h2>")
-    parts.append('<div class="chart-wrapper"><canvas id="monthlyChart" height="320"></canvas></div>')
-    parts.append(monthly_table)
-    parts.append("</section>")
-
-    parts.append("<section>")
-    parts.append("<h2>4. 주요 이슈</h2>")
-    parts.append(issues)
-    parts.append("</section>")
-
-    parts.append("<section>")
-    parts.append("<h2>5. 향후 조치 계획</h2>")
-    parts.append(next_steps)
-    parts.append("<p class=\"footnote\">※ 본 문서는 내부 검토용 공문서 형식을 따릅니다.</p>")
-    parts.append("</section>")
-
-    parts.append("</main>")
-    parts.append('<script src="https://cdn.jsdelivr.net/npm/chart.js"></script>')
-    parts.append("<script>")
-    parts.append(
+def html_head(model: ReportModel) -> str:
+    title = escape(model.title)
+    return "".join([
+        "<!DOCTYPE html>",
+        "<html lang=\"ko\">",
+        "<head>",
+        "<meta charset=\"utf-8\">",
+        "<title>" + title + "</title>",
+        '<meta name="viewport" content="width=device-width, initial-scale=1">',
+        '<link rel="preconnect" href="https://fonts.gstatic.com">',
+        '<link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;600&display=swap" rel="stylesheet">',
+        STYLE_BLOCK,
+        "</head>",
+        "<body>",
+        "<header>",
+        f"<h1>{title}</h1>",
+        f"<p>작성일: {escape(model.date_label)}</p>",
+        "<p>문서번호: " + escape(model.doc_number) + "</p>",
+        "</header>",
+        "<main>",
+    ])
+
+
+def html_summary_section(model: ReportModel) -> str:
+    return "<section><h2>1. 핵심 지표 요약</h2>" + build_summary_cards(model.summary) + "</section>"
+
+
+def html_department_section(model: ReportModel) -> str:
+    return "<section><h2>2. 부처별 운영 현황</h2>" + build_department_table(model.departments) + "</section>"
+
+
+def html_monthly_section(model: ReportModel) -> str:
+    return (
+        "<section><h2>3. 월별 이용 추이</h2>"
+        '<div class="chart-wrapper"><canvas id="monthlyChart" height="320"></canvas></div>'
+        + build_monthly_table(model.monthly_stats)
+        + "</section>"
+    )
+
+
+def html_issues_section(model: ReportModel) -> str:
+    return "<section><h2>4. 주요 이슈</h2>" + build_list(model.issues) + "</section>"
+
+
+def html_next_steps_section(model: ReportModel) -> str:
+    return (
+        "<section><h2>5. 향후 조치 계획</h2>"
+        + build_list(model.next_steps)
+        + "<p class=\"footnote\">※ 본 문서는 내부 검토용 공문서 형식을 따릅니다.</p>"
+        "</section></main>"
+    )
+
+
+def html_chart_script(model: ReportModel) -> str:
+    monthly_json = json.dumps(model.monthly_stats, ensure_ascii=False)
+    return (
+        '<script src="https://cdn.jsdelivr.net/npm/chart.js"></script>'
+        "<script>"
         "const monthlyData = " + monthly_json + ";\n"
         "const labels = monthlyData.map(item => item.month);\n"
         "const userData = monthlyData.map(item => item.users);\n"
@@ -291,32 +471,457 @@ def render_report(data: Dict[str, Any]) -> str:
         "        }\n"
         "    }\n"
         "});"
+        "</script>"
+        "</body></html>"
     )
-    parts.append("</script>")
-    parts.append("</body></html>")
 
-    return "".join(parts)
 
+# (섹션 이름, 섹션이 사용하는 입력 JSON 루트 키, 렌더 함수) - 문서 순서대로 나열
+HTML_SECTIONS: List[Tuple[str, Tuple[str, ...], Callable[[ReportModel], str]]] = [
+    ("head", ("title", "date"), html_head),
+    ("build_summary_cards", ("summary",), html_summary_section),
+    ("build_department_table", ("departments",), html_department_section),
+    ("build_monthly_table", ("monthly_stats",), html_monthly_section),
+    ("issues", ("issues",), html_issues_section),
+    ("next_steps", ("next_steps",), html_next_steps_section),
+    ("monthly_json", ("monthly_stats",), html_chart_script),
+]
+
+
+def write_html(model: ReportModel, fh: TextIO, profiler: Profiler = NULL_PROFILER) -> None:
+    for name, _, render in HTML_SECTIONS:
+        with profiler.stage(f"html.{name}", fh):
+            fh.write(render(model))
+
+
+def write_csv(model: ReportModel, fh: TextIO, profiler: Profiler = NULL_PROFILER) -> None:
+    # section,item,field,value 형태의 long format으로 기록 (item은 1부터 시작하는 행 번호)
+    writer = csv.writer(fh)
+    with profiler.stage("csv.summary", fh):
+        writer.writerow(["section", "item", "field", "value"])
+        writer.writerow(["meta", "", "title", model.title])
+        writer.writerow(["meta", "", "date", model.date])
+        writer.writerow(["meta", "", "doc_number", model.doc_number])
+        for item in model.summary:
+            writer.writerow(["summary", "", item["key"], item["value"]])
+    for section, rows in (("departments", model.departments), ("monthly_stats", model.monthly_stats)):
+        with profiler.stage(f"csv.{section}", fh):
+            for index, row in enumerate(rows, start=1):
+                writer.writerows([section, index, key, value] for key, value in row.items())
+    for section, items in (("issues", model.issues), ("next_steps", model.next_steps)):
+        with profiler.stage(f"csv.{section}", fh):
+            writer.writerows([section, index, "text", text] for index, text in enumerate(items, start=1))
+
+
+def write_json(model: ReportModel, fh: TextIO, profiler: Profiler = NULL_PROFILER) -> None:
+    with profiler.stage("json.dump", fh):
+        json.dump(model.to_dict(), fh, ensure_ascii=False, indent=2)
+        fh.write("\n")
+
+
+def md_cell(text: str) -> str:
+    return text.replace("|", "\\|").replace("\n", " ")
+
+
+def write_md_table(fh: TextIO, columns: List[tuple], rows: Iterable[Dict[str, Any]]) -> None:
+    fh.write("| " + " | ".join(label for _, label, _ in columns) + " |\n")
+    fh.write("|" + " --- |" * len(columns) + "\n")
+    for row in rows:
+        cells = (md_cell(format_cell(row.get(key), decimals)) for key, _, decimals in columns)
+        fh.write("| " + " | ".join(cells) + " |\n")
 
-def generate_report(input_path: Path, output_path: Path) -> Path:
-    data = load_data(input_path)
-    html = render_report(data)
-    output_path.write_text(html, encoding="utf-8")
+
+def write_markdown(model: ReportModel, fh: TextIO, profiler: Profiler = NULL_PROFILER) -> None:
+    write = fh.write
+    with profiler.stage("md.summary", fh):
+        write(f"# {model.title}\n\n")
+        write(f"- 작성일: {model.date_label}\n")
+        write(f"- 문서번호: {model.doc_number}\n\n")
+
+        write("## 1. 핵심 지표 요약\n\n")
+        write("| 지표 | 값 |\n| --- | --- |\n")
+        for item in model.summary:
+            write(f"| {md_cell(item['label'])} | {md_cell(format_summary_value(item))} |\n")
+
+    with profiler.stage("md.departments", fh):
+        write("\n## 2. 부처별 운영 현황\n\n")
+        write_md_table(fh, DEPARTMENT_COLUMNS, model.departments)
+
+    with profiler.stage("md.monthly_stats", fh):
+        write("\n## 3. 월별 이용 추이\n\n")
+        write_md_table(fh, MONTHLY_COLUMNS, model.monthly_stats)
+
+    with profiler.stage("md.issues", fh):
+        write("\n## 4. 주요 이슈\n\n")
+        write("".join(f"- {item}\n" for item in model.issues))
+
+    with profiler.stage("md.next_steps", fh):
+        write("\n## 5. 향후 조치 계획\n\n")
+        write("".join(f"- {item}\n" for item in model.next_steps))
+        write("\n> ※ 본 문서는 내부 검토용 공문서 형식을 따릅니다.\n")
+
+
+WRITERS: Dict[str, Callable[[ReportModel, TextIO, Profiler], None]] = {
+    "html": write_html,
+    "csv": write_csv,
+    "json": write_json,
+    "md": write_markdown,
+}
+
+
+def render_report(data: Dict[str, Any]) -> str:
+    buffer = io.StringIO()
+    write_html(normalize_report(data), buffer)
+    return buffer.getvalue()
+
+
+@contextmanager
+def atomic_open(path: Path, encoding: str = "utf-8", newline: str | None = None) -> Iterator[TextIO]:
+    # 같은 폴더의 임시 파일에 기록한 뒤 교체하여, 읽는 쪽에서 반쯤 쓰인 파일을 보지 않도록 함
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding=encoding, newline=newline) as fh:
+            yield fh
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_name, 0o666 & ~umask)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+def write_report(model: ReportModel, fmt: str, output_path: Path, profiler: Profiler = NULL_PROFILER) -> Path:
+    # CSV는 엑셀에서 한글이 깨지지 않도록 BOM을 붙여 저장
+    encoding = "utf-8-sig" if fmt == "csv" else "utf-8"
+    newline = "" if fmt == "csv" else None
+    with profiler.stage(f"write.{fmt}"):
+        with atomic_open(output_path, encoding, newline) as fh:
+            WRITERS[fmt](model, fh, profiler)
+    if isinstance(profiler, RenderProfiler):
+        profiler.record_output(fmt, output_path)
     return output_path
 
 
+def generate_reports(
+    input_path: Path,
+    output_path: Path,
+    formats: Iterable[str] = ("html",),
+    profiler: Profiler = NULL_PROFILER,
+) -> List[Path]:
+    """데이터를 한 번만 읽고 정규화한 뒤 요청된 모든 형식으로 기록한다.
+
+    출력 파일명은 ``output_path``의 확장자를 형식별 확장자로 바꿔 결정한다.
+    """
+    targets = [(fmt, output_path.with_suffix(FORMAT_EXTENSIONS[fmt])) for fmt in formats]
+    for _, target in targets:
+        if target.resolve() == input_path.resolve():
+            raise ValueError(f"출력 경로가 입력 파일과 같습니다: {target}")
+    with profiler.stage("load_data"):
+        data = load_data(input_path)
+    with profiler.stage("normalize_report"):
+        model = normalize_report(data)
+    return [write_report(model, fmt, target, profiler) for fmt, target in targets]
+
+
+def generate_report(input_path: Path, output_path: Path) -> Path:
+    model = normalize_report(load_data(input_path))
+    return write_report(model, "html", output_path)
+
+
+class IncrementalHtmlRenderer:
+    """입력 JSON에서 바뀐 루트 키에 해당하는 HTML 섹션만 다시 렌더링한다.
+
+    섹션별로 직전 입력 값과 렌더링 결과를 보관하고, 값이 같으면 결과를 재사용한다.
+    """
+
+    def __init__(self) -> None:
+        self._inputs: Dict[str, Tuple[Any, ...]] = {}
+        self._fragments: Dict[str, str] = {}
+
+    def render(self, data: Dict[str, Any], now: datetime | None = None) -> Tuple[str, List[str]]:
+        now = now or datetime.now()
+        # 문서번호가 날짜를 포함하므로 날짜가 바뀌면 모든 섹션을 다시 만든다
+        today = now.strftime("%Y%m%d")
+        dirty_keys = set()
+        pending: List[Tuple[str, Tuple[Any, ...]]] = []
+        for name, keys, _ in HTML_SECTIONS:
+            current = tuple(data.get(key) for key in keys) + (today,)
+            if name not in self._fragments or self._inputs[name] != current:
+                pending.append((name, current))
+                dirty_keys.update(keys)
+
+        if pending:
+            # 바뀐 키만 정규화하고, 나머지 키는 정규화 비용을 들이지 않는다
+            model = normalize_report({key: data[key] for key in dirty_keys if key in data}, now)
+            renderers = {name: render for name, _, render in HTML_SECTIONS}
+            for name, current in pending:
+                self._fragments[name] = renderers[name](model)
+                self._inputs[name] = current
+        html = "".join(self._fragments[name] for name, _, _ in HTML_SECTIONS)
+        return html, [name for name, _ in pending]
+
+
+class PollingWatcher:
+    """파일의 수정 시각과 크기를 주기적으로 비교하는 감시기 (모든 OS 지원)."""
+
+    def __init__(self, paths: Iterable[Path], interval: float = 0.1) -> None:
+        self.paths = [path.resolve() for path in paths]
+        self.interval = interval
+        self._signatures = self._snapshot()
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int] | None]:
+        signatures: Dict[Path, Tuple[int, int] | None] = {}
+        for path in self.paths:
+            try:
+                stat = path.stat()
+                signatures[path] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                signatures[path] = None
+        return signatures
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """변경이 감지되면 True, ``timeout``초 동안 변경이 없으면 False를 반환한다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._snapshot()
+            if current != self._signatures:
+                self._signatures = current
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(self.interval, remaining))
+            else:
+                time.sleep(self.interval)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify(ctypes)로 파일 변경을 감시한다.
+
+    편집기가 임시 파일을 만든 뒤 이름을 바꿔 저장하는 경우도 잡기 위해 파일이 아닌
+    상위 폴더를 감시하고 이벤트의 파일명으로 걸러낸다.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify는 Linux에서만 사용할 수 있습니다.")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._names: Dict[int, set] = {}
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        try:
+            for path in paths:
+                path = path.resolve()
+                wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path.parent), mask)
+                if wd < 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, os.strerror(errno), str(path.parent))
+                self._names.setdefault(wd, set()).add(os.fsencode(path.name))
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def _drain(self) -> bool:
+        matched = False
+        while True:
+            try:
+                buffer = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return matched
+            offset = 0
+            while offset < len(buffer):
+                wd, _, _, length = self.EVENT_HEADER.unpack_from(buffer, offset)
+                offset += self.EVENT_HEADER.size
+                name = buffer[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if name in self._names.get(wd, ()):
+                    matched = True
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """변경이 감지되면 True, ``timeout``초 동안 변경이 없으면 False를 반환한다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return False
+            if self._drain():
+                return True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def create_watcher(paths: List[Path], force_polling: bool = False) -> PollingWatcher | InotifyWatcher:
+    if not force_polling:
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            # inotify를 쓸 수 없는 환경(Windows/macOS, 감시 개수 한도 초과 등)은 폴링으로 대체
+            pass
+    return PollingWatcher(paths)
+
+
+def watch_reports(
+    input_path: Path,
+    output_path: Path,
+    formats: Iterable[str] = ("html",),
+    debounce: float = 0.05,
+    force_polling: bool = False,
+) -> None:
+    """입력 JSON이 바뀔 때마다 보고서를 다시 생성한다 (Ctrl+C로 종료).
+
+    짧은 시간에 연속된 저장은 ``debounce``초 동안 추가 변경이 없을 때 한 번만 처리하며,
+    HTML은 바뀐 섹션만 다시 렌더링한다. 모든 출력은 원자적으로 교체된다.
+    """
+    targets = [(fmt, output_path.with_suffix(FORMAT_EXTENSIONS[fmt])) for fmt in formats]
+    for _, target in targets:
+        if target.resolve() == input_path.resolve():
+            raise ValueError(f"출력 경로가 입력 파일과 같습니다: {target}")
+    renderer = IncrementalHtmlRenderer()
+
+    def rebuild() -> None:
+        start = time.perf_counter()
+        try:
+            data = load_data(input_path)
+        except (OSError, ValueError) as exc:
+            # 저장 도중이거나 JSON 문법 오류인 경우 다음 변경을 기다린다
+            print(f"입력을 읽을 수 없습니다: {exc}", file=sys.stderr)
+            return
+        if not isinstance(data, dict):
+            print(f"입력 최상위 값은 객체여야 합니다 (현재: {type(data).__name__})", file=sys.stderr)
+            return
+        model: ReportModel | None = None
+        changed: List[str] = []
+        try:
+            for fmt, target in targets:
+                if fmt == "html":
+                    html, changed = renderer.render(data)
+                    with atomic_open(target) as fh:
+                        fh.write(html)
+                else:
+                    model = model or normalize_report(data)
+                    write_report(model, fmt, target)
+        except (OSError, ValueError, TypeError, AttributeError, KeyError) as exc:
+            # 필드 형식이 잘못되었거나 출력에 실패해도 감시는 계속한다
+            print(f"보고서를 생성할 수 없습니다: {exc}", file=sys.stderr)
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        sections = ", ".join(changed) if changed else "-"
+        print(f"[{datetime.now():%H:%M:%S}] 보고서 갱신 ({elapsed:.1f}ms, 다시 그린 섹션: {sections})")
+
+    watcher = create_watcher([input_path], force_polling)
+    mode = "폴링" if isinstance(watcher, PollingWatcher) else "inotify"
+    print(f"감시 시작 ({mode}): {input_path.resolve()} - 종료하려면 Ctrl+C")
+    try:
+        rebuild()
+        while True:
+            if not watcher.wait():
+                continue
+            while watcher.wait(debounce):
+                pass
+            rebuild()
+    except KeyboardInterrupt:
+        print("감시를 종료합니다.")
+    finally:
+        watcher.close()
+
+
+def parse_formats(value: str) -> List[str]:
+    formats: List[str] = []
+    for name in value.split(","):
+        name = name.strip().lower()
+        if name == "all":
+            candidates = list(REPORT_FORMATS)
+        elif name in REPORT_FORMATS:
+            candidates = [name]
+        else:
+            raise argparse.ArgumentTypeError(
+                f"지원하지 않는 형식입니다: {name} (선택: {', '.join(REPORT_FORMATS)}, all)"
+            )
+        formats.extend(fmt for fmt in candidates if fmt not in formats)
+    return formats
+
+
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="JSON 데이터를 HTML 보고서로 변환")
+    parser = argparse.ArgumentParser(description="JSON 데이터를 HTML/CSV/JSON/Markdown 보고서로 변환")
     parser.add_argument("input", nargs="?", default="report_data.json", help="입력 JSON 경로")
-    parser.add_argument("-o", "--output", default="report.html", help="생성할 HTML 경로")
-    return parser.parse_args()
+    parser.add_argument("-o", "--output", default="report.html", help="생성할 보고서 경로 (형식별 확장자로 자동 변경)")
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="formats",
+        type=parse_formats,
+        default=["html"],
+        help="출력 형식 목록, 쉼표로 구분 (html,csv,json,md 또는 all, 기본값: html)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="단계별 소요 시간/출력 바이트/최대 메모리를 JSON으로 기록할 경로 ('-'이면 표준 출력)",
+    )
+    parser.add_argument("-w", "--watch", action="store_true", help="입력 JSON이 바뀔 때마다 보고서를 다시 생성")
+    parser.add_argument("--poll", action="store_true", help="감시 모드에서 inotify 대신 폴링 사용")
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=50,
+        metavar="MS",
+        help="감시 모드에서 연속 저장을 하나로 묶는 대기 시간 (밀리초, 기본값: 50)",
+    )
+    args = parser.parse_args()
+    if args.watch and args.profile:
+        parser.error("--watch와 --profile은 함께 사용할 수 없습니다.")
+    return args
+
+
+def write_profile(report: Dict[str, Any], destination: str) -> None:
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if destination == "-":
+        print(text)
+    else:
+        Path(destination).write_text(text + "\n", encoding="utf-8")
 
 
 def main() -> None:
     args = parse_args()
-    output = generate_report(Path(args.input), Path(args.output))
-    print(f"보고서가 생성되었습니다: {output.resolve()}")
+    if args.watch:
+        try:
+            watch_reports(Path(args.input), Path(args.output), args.formats, args.debounce / 1000, args.poll)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+        return
+    profiler = RenderProfiler() if args.profile else NULL_PROFILER
+    try:
+        outputs = generate_reports(Path(args.input), Path(args.output), args.formats, profiler)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    finally:
+        if isinstance(profiler, RenderProfiler):
+            report = profiler.report()
+            profiler.close()
+    # 프로파일 JSON을 표준 출력으로 보낼 때는 안내 문구를 표준 오류로 분리
+    stream = sys.stderr if args.profile == "-" else sys.stdout
+    for output in outputs:
+        print(f"보고서가 생성되었습니다: {output.resolve()}", file=stream)
+    if args.profile:
+        write_profile(report, args.profile)
 
 
 if __name__ == "__main__":
-    main()
+    main()
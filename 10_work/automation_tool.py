@@ -3,16 +3,328 @@
 from __future__ import annotations
 
 import argparse
+import bz2
+import ctypes
+import ctypes.util
 import json
 import logging
+import os
+import queue
+import select
 import shutil
+import sqlite3
+import struct
 import sys
-from datetime import datetime, timedelta
+import tempfile
+import threading
+import time
+import zlib
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from fnmatch import fnmatch
 from hashlib import sha256
-from pathlib import Path
-from typing import Any, Dict, Iterable, List
-from zipfile import ZIP_DEFLATED, ZipFile
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path, PurePath, PurePosixPath
+from stat import S_ISDIR, S_ISLNK, S_ISREG
+from typing import Any, BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Set, Tuple
+from zipfile import ZIP_BZIP2, ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+
+@dataclass(eq=False)
+class FileEntry:
+    """색인에 저장되는 파일 한 개의 메타데이터."""
+
+    path: Path
+    relative: PurePosixPath
+    size: int
+    mtime_ns: int
+    inode: int
+    device: int
+    # 드라이런에서 색인상으로만 옮긴 파일의 실제 위치
+    origin: Path | None = None
+
+    @property
+    def modified(self) -> datetime:
+        return datetime.fromtimestamp(self.mtime_ns / 1_000_000_000)
+
+    @property
+    def disk_path(self) -> Path:
+        return self.origin or self.path
+
+
+class FileIndex:
+    """루트 폴더를 ``os.scandir``로 한 번만 순회하여 만든 파일/폴더 색인.
+
+    모든 단계가 디렉터리를 다시 순회하거나 ``stat()``을 반복 호출하지 않고 이 색인을
+    조회하며, 파일을 옮기거나 지우는 단계는 색인도 함께 갱신한다.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.files: Dict[Path, FileEntry] = {}
+        self.dirs: Set[Path] = set()
+
+    @classmethod
+    def scan(cls, root: Path) -> "FileIndex":
+        index = cls(root)
+        for path, stat in index._walk(root):
+            if stat is None:
+                index.dirs.add(path)
+            else:
+                index.add(path, stat)
+        return index
+
+    def _walk(self, start: Path) -> Iterator[Tuple[Path, os.stat_result | None]]:
+        """``start`` 아래의 폴더는 ``(경로, None)``, 파일은 ``(경로, stat)``으로 내보낸다."""
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            try:
+                iterator = os.scandir(current)
+            except OSError:
+                continue
+            with iterator:
+                for entry in iterator:
+                    try:
+                        # 심볼릭 링크 폴더는 따라 들어가지 않음 (rglob과 동일)
+                        if entry.is_dir(follow_symlinks=False):
+                            if current == self.root and entry.name == STATE_DIR_NAME:
+                                continue
+                            path = Path(entry.path)
+                            yield path, None
+                            stack.append(path)
+                        elif entry.is_file():
+                            yield Path(entry.path), entry.stat()
+                    except OSError:
+                        continue
+
+    def refresh(self, paths: Iterable[Path]) -> Set[Path]:
+        """``paths``(파일 또는 폴더)를 디스크 상태와 다시 맞추고, 실제로 추가·변경·삭제된 파일 경로를 반환한다.
+
+        색인에 이미 반영된 변경(이 도구가 직접 옮기거나 만든 파일)은 결과에 포함되지 않는다.
+        """
+        changed: Set[Path] = set()
+        for path in paths:
+            try:
+                stat = os.stat(path, follow_symlinks=False)
+                if S_ISLNK(stat.st_mode):
+                    # scan과 같이 파일 링크는 파일로 취급하고 폴더 링크는 따라가지 않음
+                    stat = os.stat(path)
+                    stat = None if S_ISDIR(stat.st_mode) else stat
+            except OSError:
+                stat = None
+            if stat is not None and S_ISDIR(stat.st_mode):
+                if path != self.root:
+                    self._register_parents(path)
+                    self.dirs.add(path)
+                known = {p for p in self.files if path in p.parents}
+                known_dirs = {d for d in self.dirs if path in d.parents}
+                for found, found_stat in self._walk(path):
+                    if found_stat is None:
+                        known_dirs.discard(found)
+                        self.dirs.add(found)
+                        continue
+                    known.discard(found)
+                    if self._update(found, found_stat):
+                        changed.add(found)
+                for missing in known:
+                    self.remove(missing)
+                    changed.add(missing)
+                self.dirs.difference_update(known_dirs)
+            elif stat is not None and S_ISREG(stat.st_mode):
+                if self._update(path, stat):
+                    changed.add(path)
+            else:
+                # 삭제되었거나 폴더 밖으로 이동한 경로 (폴더였다면 하위 항목 전체)
+                if self.files.pop(path, None) is not None:
+                    changed.add(path)
+                removed = {p for p in self.files if path in p.parents}
+                for missing in removed:
+                    self.remove(missing)
+                changed.update(removed)
+                self.dirs.discard(path)
+                self.dirs.difference_update({d for d in self.dirs if path in d.parents})
+        return changed
+
+    def _update(self, path: Path, stat: os.stat_result) -> bool:
+        stat = self._with_inode(path, stat)
+        entry = self.files.get(path)
+        if (
+            entry is not None
+            and entry.size == stat.st_size
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.inode == stat.st_ino
+        ):
+            return False
+        self.add(path, stat)
+        return True
+
+    @staticmethod
+    def _with_inode(path: Path, stat: os.stat_result) -> os.stat_result:
+        # Windows의 os.DirEntry.stat()은 st_ino/st_dev를 0으로 채우므로 해시 캐시 키로 쓰려면 다시 조회
+        if stat.st_ino == 0:
+            with suppress(OSError):
+                return path.stat()
+        return stat
+
+    def add(self, path: Path, stat: os.stat_result | None = None) -> FileEntry:
+        stat = self._with_inode(path, stat) if stat is not None else path.stat()
+        entry = FileEntry(
+            path=path,
+            relative=PurePosixPath(path.relative_to(self.root).as_posix()),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            device=stat.st_dev,
+        )
+        self.files[path] = entry
+        self._register_parents(path)
+        return entry
+
+    def _register_parents(self, path: Path) -> None:
+        for parent in path.parents:
+            if parent == self.root or self.root not in parent.parents:
+                break
+            self.dirs.add(parent)
+
+    def iter_files(self, folder: Path | None = None, exclude_parts: Iterable[str] = ()) -> List[FileEntry]:
+        """``folder`` 아래(없으면 전체)의 파일 목록. 경로에 ``exclude_parts`` 폴더명이 있으면 제외."""
+        excluded = set(exclude_parts)
+        prefix = None if folder is None else PurePosixPath(folder.relative_to(self.root).as_posix())
+        result: List[FileEntry] = []
+        for entry in self.files.values():
+            parts = entry.relative.parts
+            if excluded and not excluded.isdisjoint(parts[:-1]):
+                continue
+            if prefix is not None and parts[: len(prefix.parts)] != prefix.parts:
+                continue
+            result.append(entry)
+        return result
+
+    def move(self, source: Path, destination: Path) -> None:
+        entry = self.files.pop(source, None)
+        if entry is None:
+            return
+        entry.path = destination
+        entry.relative = PurePosixPath(destination.relative_to(self.root).as_posix())
+        self.files[destination] = entry
+        self._register_parents(destination)
+
+    def remove(self, path: Path) -> None:
+        self.files.pop(path, None)
+
+    def remove_dir(self, path: Path) -> None:
+        self.dirs.discard(path)
+
+
+class HashCache:
+    """(device, inode, size, mtime_ns)를 키로 파일 해시를 보관하는 SQLite 캐시.
+
+    크기나 수정 시각이 바뀐 파일은 캐시를 무시하고 다시 해시하며, 같은 파일시스템 안에서
+    이동한 파일은 inode가 그대로이므로 캐시가 계속 유효하다. inode를 알 수 없는(0인) 파일은
+    다른 파일과 키가 겹치므로 캐시하지 않는다.
+    """
+
+    KINDS = ("edge", "full")
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            " device INTEGER NOT NULL, inode INTEGER NOT NULL,"
+            " size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,"
+            " edge TEXT, full TEXT,"
+            " PRIMARY KEY (device, inode))"
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, entries: Iterable[FileEntry], kind: str) -> Dict[FileEntry, str]:
+        if kind not in self.KINDS:
+            raise ValueError(f"알 수 없는 해시 종류: {kind}")
+        found: Dict[FileEntry, str] = {}
+        query = f"SELECT {kind} FROM hashes WHERE device = ? AND inode = ? AND size = ? AND mtime_ns = ?"
+        for entry in entries:
+            if not entry.inode:
+                self.misses += 1
+                continue
+            row = self.conn.execute(query, (entry.device, entry.inode, entry.size, entry.mtime_ns)).fetchone()
+            if row and row[0]:
+                found[entry] = row[0]
+                self.hits += 1
+            else:
+                self.misses += 1
+        return found
+
+    def store(self, digests: Dict[FileEntry, str], kind: str) -> None:
+        if kind not in self.KINDS:
+            raise ValueError(f"알 수 없는 해시 종류: {kind}")
+        # 파일이 바뀌어 크기/수정 시각이 달라졌다면 다른 종류의 해시는 버림
+        other = "full" if kind == "edge" else "edge"
+        self.conn.executemany(
+            f"INSERT INTO hashes (device, inode, size, mtime_ns, {kind}) VALUES (?, ?, ?, ?, ?) "
+            f"ON CONFLICT (device, inode) DO UPDATE SET {kind} = excluded.{kind}, "
+            f"{other} = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns THEN {other} END, "
+            "size = excluded.size, mtime_ns = excluded.mtime_ns",
+            [(e.device, e.inode, e.size, e.mtime_ns, digest) for e, digest in digests.items() if e.inode],
+        )
+        self.conn.commit()
+
+    def prune(self, live_entries: Iterable[FileEntry]) -> int:
+        """현재 색인에 없는 파일(삭제되었거나 바뀐 파일)의 캐시 항목을 지우고 삭제 수를 반환한다."""
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS live (device INTEGER, inode INTEGER, size INTEGER, mtime_ns INTEGER)")
+        self.conn.execute("DELETE FROM live")
+        self.conn.executemany(
+            "INSERT INTO live VALUES (?, ?, ?, ?)",
+            ((e.device, e.inode, e.size, e.mtime_ns) for e in live_entries),
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS temp.live_key ON live (device, inode, size, mtime_ns)")
+        cursor = self.conn.execute(
+            "DELETE FROM hashes WHERE NOT EXISTS (SELECT 1 FROM live WHERE live.device = hashes.device"
+            " AND live.inode = hashes.inode AND live.size = hashes.size AND live.mtime_ns = hashes.mtime_ns)"
+        )
+        self.conn.execute("DELETE FROM live")
+        self.conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+# 해시 캐시 등 도구 내부 상태를 보관하는 폴더 (루트 바로 아래, 색인에서 제외)
+STATE_DIR_NAME = ".automation_state"
+# 증분 백업의 내용 주소 기반 객체 저장소 (backups/ 아래, 모든 폴더가 공유)
+OBJECTS_DIR_NAME = "objects"
+# 중복/만료 정리에서 제외할 폴더 이름 (백업 결과물과 격리된 파일)
+WORKSPACE_EXCLUDED_PARTS = ("backups", "quarantine")
+# 중복 후보를 좁히기 위해 해시하는 파일 앞/뒤 구간 크기와 전체 해시 읽기 버퍼 크기
+EDGE_HASH_BYTES = 4 * 1024
+HASH_BUFFER_SIZE = 1024 * 1024
+
+# 백업 압축 코덱별 기본 레벨과 ZIP 압축 방식 번호
+CODEC_DEFAULT_LEVELS = {"deflate": 6, "bzip2": 9, "store": 0}
+ZIP_METHODS = {"deflate": ZIP_DEFLATED, "bzip2": ZIP_BZIP2, "store": ZIP_STORED}
+# 증분 백업 객체 파일의 코덱별 확장자
+OBJECT_SUFFIXES = {"deflate": ".z", "bzip2": ".bz2", "store": ""}
+# 이미 압축된 형식이라 다시 압축해도 크기가 거의 줄지 않는 확장자
+INCOMPRESSIBLE_EXTENSIONS = {
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".zst",
+    ".docx", ".xlsx", ".pptx", ".hwpx", ".odt", ".ods", ".odp",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".heic",
+    ".mp3", ".mp4", ".m4a", ".mov", ".avi", ".mkv",
+}
+# 파일 앞부분 표본을 빠르게 압축해 보고, 크기가 10% 이상 줄지 않으면 저장만 함
+COMPRESSION_SAMPLE_BYTES = 64 * 1024
+COMPRESSION_SAMPLE_MIN = 4 * 1024
+COMPRESSION_MIN_SAVING = 0.9
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+ZIP64_LIMIT = 0xFFFFFFFF
+UTF8_FLAG = 0x800
 
 
 def load_config(path: Path) -> Dict[str, Any]:
@@ -20,201 +332,1670 @@ def load_config(path: Path) -> Dict[str, Any]:
         return json.load(fh)
 
 
-def setup_logger(log_dir: Path) -> logging.Logger:
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / f"automation_{datetime.now():%Y%m%d}.log"
+LOG_LEVELS = {"debug": logging.DEBUG, "info": logging.INFO, "warning": logging.WARNING, "error": logging.ERROR}
+EVENT_BATCH_SIZE = 256
+EVENT_FLUSH_SECONDS = 1.0
+DEFAULT_METRICS_FILE = "logs/automation_metrics.prom"
+
+_log_queue: "queue.Queue[logging.LogRecord] | None" = None
+_log_listener: QueueListener | None = None
+
+
+def event(name: str, **fields: Any) -> Dict[str, Any]:
+    """``logger.info(..., extra=event("file_moved", source=...))``처럼 로그에 구조화 필드를 붙인다."""
+    return {"event": name, "fields": fields}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON 이벤트로 변환한다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "event": getattr(record, "event", "message"),
+            "msg": record.getMessage(),
+        }
+        data.update(getattr(record, "fields", {}))
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class JsonLinesHandler(logging.Handler):
+    """JSON Lines 이벤트 로그. 레코드를 모아 두었다가 ``batch_size``개 또는 일정 시간마다 한 번에 기록한다."""
+
+    def __init__(self, path: Path, batch_size: int = EVENT_BATCH_SIZE) -> None:
+        super().__init__()
+        self.setFormatter(JsonLinesFormatter())
+        self.stream = path.open("a", encoding="utf-8")
+        self.batch_size = batch_size
+        self.buffer: List[str] = []
+        self.last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self.buffer) >= self.batch_size or time.monotonic() - self.last_flush >= EVENT_FLUSH_SECONDS:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.buffer:
+                self.stream.write("\n".join(self.buffer) + "\n")
+                self.buffer.clear()
+            self.stream.flush()
+            self.last_flush = time.monotonic()
+
+    def close(self) -> None:
+        with self.lock:
+            self.flush()
+            self.stream.close()
+        super().close()
+
+
+def log_file_paths(log_dir: Path, day: date | None = None) -> Tuple[Path, Path]:
+    """날짜별 텍스트 로그와 JSON Lines 이벤트 로그 경로."""
+    stamp = f"{day or datetime.now():%Y%m%d}"
+    return log_dir / f"automation_{stamp}.log", log_dir / f"automation_{stamp}.jsonl"
+
+
+def setup_logger(log_dir: Path | None, options: Dict[str, Any] | None = None) -> logging.Logger:
+    """콘솔·텍스트 로그·JSON Lines 이벤트 로그를 설정한다.
+
+    실제 기록은 별도 스레드(QueueListener)에서 하므로 작업 스레드는 큐에 넣기만 한다.
+    ``options``는 설정 파일의 ``logging`` 섹션이다 (``level``, ``text_log``, ``events``).
+    """
+    close_logger()
+    options = options or {}
+    level_name = str(options.get("level", "info")).lower()
+    if level_name not in LOG_LEVELS:
+        raise ValueError(f"알 수 없는 로그 레벨: {level_name} (사용 가능: {', '.join(LOG_LEVELS)})")
+
     logger = logging.getLogger("automation")
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVELS[level_name])
     logger.handlers.clear()
+    logger.propagate = False
 
     formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    handlers: List[logging.Handler] = []
 
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # log_dir가 없으면 (예: restore, 드라이런) 콘솔에만 기록
+    if log_dir is not None:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        text_path, events_path = log_file_paths(log_dir)
+        if options.get("text_log", True):
+            file_handler = logging.FileHandler(text_path, encoding="utf-8")
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        if options.get("events", True):
+            handlers.append(JsonLinesHandler(events_path))
 
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+    handlers.append(stream_handler)
 
+    global _log_queue, _log_listener
+    _log_queue = queue.Queue()
+    _log_listener = QueueListener(_log_queue, *handlers)
+    _log_listener.start()
+    logger.addHandler(QueueHandler(_log_queue))
     return logger
 
 
-def should_exclude(relative_path: Path, patterns: Iterable[str]) -> bool:
+def flush_logger() -> None:
+    """큐에 쌓인 로그를 모두 기록한다 (데몬이 다음 실행까지 대기하기 전 등)."""
+    if _log_queue is None or _log_listener is None:
+        return
+    _log_queue.join()
+    for handler in _log_listener.handlers:
+        handler.flush()
+
+
+def close_logger() -> None:
+    """로그 기록 스레드를 멈추고 남은 로그를 기록한 뒤 파일을 닫는다."""
+    global _log_queue, _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_queue = _log_listener = None
+
+
+class RunMetrics:
+    """한 번의 실행에 대한 처리량 집계. 카운터는 워커 스레드에서도 더할 수 있다.
+
+    ``stage`` 블록 안에서 더한 바이트 카운터(``BYTE_COUNTERS``)는 그 단계의 처리량(MB/s)에도 반영된다.
+    """
+
+    BYTE_COUNTERS = ("bytes_hashed", "bytes_compressed")
+    COUNTER_HELP = {
+        "files_scanned": "색인(또는 변경 감지)으로 확인한 파일 수",
+        "bytes_hashed": "중복 검사에서 읽어 해시한 바이트 수",
+        "bytes_compressed": "백업에서 압축(또는 저장)한 원본 바이트 수",
+        "bytes_written": "백업으로 기록한 바이트 수",
+        "files_backed_up": "백업에서 새로 읽은 파일 수",
+        "files_moved": "이동한 파일 수",
+        "folders_deleted": "삭제한 빈 폴더 수",
+        "hash_cache_hits": "해시 캐시 적중 수",
+        "hash_cache_misses": "해시 캐시에 없어 계산한 수",
+    }
+
+    def __init__(self) -> None:
+        self.counters: Dict[str, int] = dict.fromkeys(self.COUNTER_HELP, 0)
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.started = time.monotonic()
+        self.finished: float | None = None
+        self._current: str | None = None
+        self._lock = threading.Lock()
+
+    def add(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            if self._current is not None and name in self.BYTE_COUNTERS:
+                self.stages[self._current]["bytes"] += value
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        stats = self.stages.setdefault(name, {"seconds": 0.0, "bytes": 0})
+        self._current = name
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            stats["seconds"] += time.monotonic() - started
+            self._current = None
+
+    def finish(self) -> None:
+        self.finished = time.monotonic()
+
+    @property
+    def wall_seconds(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    def summary(self) -> Dict[str, Any]:
+        stages = {}
+        for name, stats in self.stages.items():
+            seconds = stats["seconds"]
+            mb = stats["bytes"] / (1024 * 1024)
+            stages[name] = {
+                "seconds": round(seconds, 6),
+                "bytes": int(stats["bytes"]),
+                "mb_per_second": round(mb / seconds, 3) if seconds > 0 else 0.0,
+            }
+        return {**self.counters, "wall_seconds": round(self.wall_seconds, 6), "stages": stages}
+
+    def log_summary(self, logger: logging.Logger) -> None:
+        summary = self.summary()
+        stages = ", ".join(
+            f"{name} {stats['seconds']:.2f}초" + (f" {stats['mb_per_second']:.1f}MB/s" if stats["bytes"] else "")
+            for name, stats in summary["stages"].items()
+        )
+        logger.info(
+            "실행 통계: 파일 %d개 확인, 해시 %s, 압축 %s, 총 %.2f초 (%s)",
+            summary["files_scanned"],
+            format_size(summary["bytes_hashed"]),
+            format_size(summary["bytes_compressed"]),
+            summary["wall_seconds"],
+            stages,
+            extra=event("run_metrics", **summary),
+        )
+
+    def write_prometheus(self, path: Path, root: Path) -> None:
+        """node_exporter textfile collector 형식으로 기록한다. 수집기가 쓰다 만 파일을 읽지 않도록 원자적으로 교체한다."""
+        label = 'root="{}"'.format(str(root).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        summary = self.summary()
+        lines: List[str] = []
+
+        def metric(name: str, help_text: str, samples: Iterable[Tuple[str, float]]) -> None:
+            lines.append(f"# HELP automation_{name} {help_text}")
+            lines.append(f"# TYPE automation_{name} gauge")
+            lines.extend(f"automation_{name}{{{labels}}} {value}" for labels, value in samples)
+
+        for name, help_text in self.COUNTER_HELP.items():
+            metric(name, help_text, [(label, summary[name])])
+        metric("run_duration_seconds", "실행 전체 소요 시간(초)", [(label, summary["wall_seconds"])])
+        metric("last_run_timestamp_seconds", "마지막 실행 종료 시각 (Unix 시간)", [(label, round(time.time(), 3))])
+        for key, name, help_text in (
+            ("seconds", "stage_duration_seconds", "단계별 소요 시간(초)"),
+            ("bytes", "stage_bytes", "단계별 처리 바이트 수 (해시·압축)"),
+            ("mb_per_second", "stage_throughput_mb_per_second", "단계별 처리량(MB/s)"),
+        ):
+            metric(
+                name,
+                help_text,
+                [(f'{label},stage="{stage}"', stats[key]) for stage, stats in summary["stages"].items()],
+            )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write("\n".join(lines) + "\n")
+            # mkstemp는 0600으로 만들므로 수집기가 읽을 수 있게 권한을 연다
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+
+
+def should_exclude(relative_path: PurePath, patterns: Iterable[str]) -> bool:
     path_str = str(relative_path).replace("\\", "/")
     return any(fnmatch(path_str, pattern) or fnmatch(relative_path.name, pattern) for pattern in patterns)
 
 
-def backup_folders(root: Path, config: Dict[str, Any], logger: logging.Logger) -> None:
+def parse_compression(value: Any) -> Tuple[str, int]:
+    """``backup_rules.compression`` 설정을 (코덱, 레벨)로 해석한다.
+
+    ``true``/``false``(기존 형식), 코덱 이름 문자열, ``{"codec": ..., "level": ...}`` 객체를 허용한다.
+    """
+    if value is None or value is True:
+        return "deflate", CODEC_DEFAULT_LEVELS["deflate"]
+    if value is False:
+        return "store", 0
+    if isinstance(value, str):
+        codec, level = value, None
+    elif isinstance(value, dict):
+        codec, level = value.get("codec", "deflate"), value.get("level")
+    else:
+        raise ValueError(f"알 수 없는 compression 설정입니다: {value!r}")
+    if codec not in CODEC_DEFAULT_LEVELS:
+        raise ValueError(f"지원하지 않는 압축 코덱입니다: {codec} (선택: {', '.join(CODEC_DEFAULT_LEVELS)})")
+    if level is None:
+        level = CODEC_DEFAULT_LEVELS[codec]
+    if codec != "store" and not (isinstance(level, int) and 1 <= level <= 9):
+        raise ValueError(f"압축 레벨은 1~9 사이 정수여야 합니다: {level!r}")
+    return codec, level
+
+
+def choose_codec(path: Path, sample: bytes, codec: str) -> str:
+    """파일별 코덱 선택. 이미 압축된 형식이거나 표본 압축률이 낮으면 압축하지 않는다."""
+    if codec == "store" or path.suffix.lower() in INCOMPRESSIBLE_EXTENSIONS:
+        return "store"
+    if len(sample) >= COMPRESSION_SAMPLE_MIN:
+        head = sample[:COMPRESSION_SAMPLE_BYTES]
+        if len(zlib.compress(head, 1)) > len(head) * COMPRESSION_MIN_SAVING:
+            return "store"
+    return codec
+
+
+def new_compressor(codec: str, level: int, raw_deflate: bool = True) -> Any:
+    if codec == "deflate":
+        # ZIP 멤버는 헤더 없는 raw deflate, 객체 저장소는 zlib 형식을 사용
+        return zlib.compressobj(level, zlib.DEFLATED, -15 if raw_deflate else zlib.MAX_WBITS)
+    if codec == "bzip2":
+        return bz2.BZ2Compressor(level)
+    return None
+
+
+@dataclass
+class PreparedMember:
+    """워커에서 미리 압축해 둔 ZIP 멤버."""
+
+    arcname: str
+    method: int
+    crc: int
+    size: int
+    compressed_size: int
+    mtime: float
+    mode: int
+    data: BinaryIO
+
+
+def prepare_member(path: Path, arcname: str, codec: str, level: int) -> PreparedMember:
+    with path.open("rb") as src:
+        stat = os.fstat(src.fileno())
+        chunk = src.read(HASH_BUFFER_SIZE)
+        member_codec = choose_codec(path, chunk, codec)
+        compressor = new_compressor(member_codec, level)
+        # 작은 결과는 메모리에, 큰 결과는 임시 파일에 보관
+        data = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        crc = 0
+        size = 0
+        while chunk:
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            data.write(compressor.compress(chunk) if compressor else chunk)
+            chunk = src.read(HASH_BUFFER_SIZE)
+        if compressor:
+            data.write(compressor.flush())
+    compressed_size = data.tell()
+    data.seek(0)
+    return PreparedMember(
+        arcname=arcname,
+        method=ZIP_METHODS[member_codec],
+        crc=crc,
+        size=size,
+        compressed_size=compressed_size,
+        mtime=stat.st_mtime,
+        mode=stat.st_mode,
+        data=data,
+    )
+
+
+def prepare_members_parallel(
+    entries: Iterable[FileEntry],
+    codec: str,
+    level: int,
+    logger: logging.Logger,
+    workers: int | None = None,
+    metrics: RunMetrics | None = None,
+) -> Iterator[PreparedMember]:
+    """스레드 풀에서 멤버를 압축하고 입력 순서대로 내보낸다.
+
+    메모리/임시 파일 사용량을 제한하기 위해 동시에 진행 중인 작업 수를 워커 수의 4배로 묶는다.
+    zlib/bz2는 압축 중 GIL을 놓으므로 스레드 수만큼 여러 코어를 사용한다.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Tuple[FileEntry, Future]] = deque()
+
+        def drain_one() -> Iterator[PreparedMember]:
+            entry, future = pending.popleft()
+            try:
+                member = future.result()
+            except OSError as exc:
+                logger.warning("백업 실패 (건너뜀): %s (%s)", entry.path, exc)
+                return
+            if metrics is not None:
+                metrics.add("files_backed_up")
+                metrics.add("bytes_compressed", member.size)
+                metrics.add("bytes_written", member.compressed_size)
+            yield member
+
+        for entry in entries:
+            pending.append((entry, pool.submit(prepare_member, entry.path, entry.relative.as_posix(), codec, level)))
+            if len(pending) >= workers * 4:
+                yield from drain_one()
+        while pending:
+            yield from drain_one()
+
+
+def dos_datetime(timestamp: float) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = time.localtime(timestamp)[:6]
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def write_zip(zip_path: Path, members: Iterable[PreparedMember]) -> int:
+    """미리 압축된 멤버들로 ZIP 파일을 조립하고 멤버 수를 반환한다 (필요 시 ZIP64 사용).
+
+    zipfile 모듈은 이미 압축된 데이터를 그대로 기록하는 API가 없으므로 헤더를 직접 쓴다.
+    """
+    central: List[bytes] = []
+    with zip_path.open("wb") as out:
+        for member in members:
+            offset = out.tell()
+            name = member.arcname.encode("utf-8")
+            dos_time, dos_date = dos_datetime(member.mtime)
+            zip64_sizes = member.size >= ZIP64_LIMIT or member.compressed_size >= ZIP64_LIMIT
+            version = max(20, 46 if member.method == ZIP_BZIP2 else 20, 45 if zip64_sizes else 20)
+            local_extra = struct.pack("<2H2Q", 1, 16, member.size, member.compressed_size) if zip64_sizes else b""
+            out.write(
+                struct.pack(
+                    "<4s2B4HL2L2H",
+                    b"PK\x03\x04",
+                    version,
+                    0,
+                    UTF8_FLAG,
+                    member.method,
+                    dos_time,
+                    dos_date,
+                    member.crc,
+                    ZIP64_LIMIT if zip64_sizes else member.compressed_size,
+                    ZIP64_LIMIT if zip64_sizes else member.size,
+                    len(name),
+                    len(local_extra),
+                )
+            )
+            out.write(name)
+            out.write(local_extra)
+            shutil.copyfileobj(member.data, out, HASH_BUFFER_SIZE)
+            member.data.close()
+
+            # 중앙 디렉터리의 ZIP64 확장 필드에는 한도를 넘는 값만 순서대로 기록
+            extra_values = [value for value in (member.size, member.compressed_size, offset) if value >= ZIP64_LIMIT]
+            central_extra = (
+                struct.pack(f"<2H{len(extra_values)}Q", 1, 8 * len(extra_values), *extra_values) if extra_values else b""
+            )
+            central.append(
+                struct.pack(
+                    "<4s4B4HL2L5H2L",
+                    b"PK\x01\x02",
+                    max(version, 45 if extra_values else 20),
+                    3,  # 생성 시스템: Unix (외부 속성에 권한 비트 기록)
+                    max(version, 45 if extra_values else 20),
+                    0,
+                    UTF8_FLAG,
+                    member.method,
+                    dos_time,
+                    dos_date,
+                    member.crc,
+                    min(member.compressed_size, ZIP64_LIMIT),
+                    min(member.size, ZIP64_LIMIT),
+                    len(name),
+                    len(central_extra),
+                    0,
+                    0,
+                    0,
+                    (member.mode & 0xFFFF) << 16,
+                    min(offset, ZIP64_LIMIT),
+                )
+                + name
+                + central_extra
+            )
+
+        cd_offset = out.tell()
+        for record in central:
+            out.write(record)
+        cd_size = out.tell() - cd_offset
+        count = len(central)
+        if count >= 0xFFFF or cd_size >= ZIP64_LIMIT or cd_offset >= ZIP64_LIMIT:
+            zip64_end = out.tell()
+            out.write(struct.pack("<4sQ2H2L4Q", b"PK\x06\x06", 44, 45, 45, 0, 0, count, count, cd_size, cd_offset))
+            out.write(struct.pack("<4sLQL", b"PK\x06\x07", 0, zip64_end, 1))
+        out.write(
+            struct.pack(
+                "<4s4H2LH",
+                b"PK\x05\x06",
+                0,
+                0,
+                min(count, 0xFFFF),
+                min(count, 0xFFFF),
+                min(cd_size, ZIP64_LIMIT),
+                min(cd_offset, ZIP64_LIMIT),
+                0,
+            )
+        )
+    return len(central)
+
+
+def backup_folders(
+    root: Path,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    index: FileIndex | None = None,
+    cache: HashCache | None = None,
+    dry_run: bool = False,
+    changed: Set[Path] | None = None,
+    metrics: RunMetrics | None = None,
+) -> None:
+    """``changed``가 주어지면 그 안의 경로가 속한 폴더만 백업한다 (보존 기간 정리는 항상 수행)."""
     rules = config.get("backup_rules", {})
     folders = rules.get("folders", [])
     exclude_patterns = rules.get("exclude_patterns", [])
     retention_days = rules.get("retention_days", 30)
+    incremental = rules.get("mode", "full") == "incremental"
+    codec, level = parse_compression(rules.get("compression", True))
+    workers = rules.get("workers")
     backup_root = root / "backups"
-    backup_root.mkdir(parents=True, exist_ok=True)
+    if not dry_run:
+        backup_root.mkdir(parents=True, exist_ok=True)
+    index = index or FileIndex.scan(root)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     logger.info("백업 작업 시작 (대상: %s)", ", ".join(folders))
+    # 새 스냅샷을 만들었거나 보존 기간 정리로 스냅샷을 지웠으면 객체 저장소를 정리
+    snapshots_changed = False
 
     for folder_name in folders:
         target_dir = root / folder_name
         if not target_dir.exists():
             logger.warning("백업 대상 폴더가 없습니다: %s", target_dir)
             continue
+        if changed is not None and not any(target_dir in path.parents for path in changed):
+            logger.info("변경 없음, 백업 건너뜀: %s", folder_name)
+            if not dry_run:
+                if incremental:
+                    snapshots_dir = backup_root / folder_name / "snapshots"
+                    if cleanup_old_backups(snapshots_dir, retention_days, logger, index, "*.json"):
+                        snapshots_changed = True
+                else:
+                    cleanup_old_backups(backup_root / folder_name, retention_days, logger, index)
+            continue
+        entries: List[FileEntry] = []
+        excluded = 0
+        for entry in index.iter_files(target_dir):
+            if should_exclude(entry.relative, exclude_patterns):
+                logger.debug("백업 제외: %s", entry.relative, extra=event("backup_excluded", path=entry.relative))
+                excluded += 1
+                continue
+            entries.append(entry)
+        if excluded:
+            logger.info("백업 제외: %s 폴더에서 %d개", folder_name, excluded)
+
+        if dry_run:
+            total = sum(entry.size for entry in entries)
+            logger.info("[드라이런] 백업 예정: %s (파일 %d개, %s)", folder_name, len(entries), format_size(total))
+            continue
+        if incremental:
+            snapshots_changed = True
+            manifest_path = backup_folder_incremental(
+                folder_name, entries, backup_root, timestamp, codec, level, logger, cache, workers, index, metrics
+            )
+            index.add(manifest_path)
+            logger.info(
+                "백업 스냅샷 생성: %s",
+                manifest_path,
+                extra=event("backup_created", folder=folder_name, path=manifest_path, files=len(entries)),
+            )
+            cleanup_old_backups(manifest_path.parent, retention_days, logger, index, "*.json")
+            continue
+
         zip_dir = backup_root / folder_name
         zip_dir.mkdir(parents=True, exist_ok=True)
         zip_path = zip_dir / f"{folder_name}_{timestamp}.zip"
-        with ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as archive:
-            for file in target_dir.rglob("*"):
-                if file.is_file():
-                    rel_path = file.relative_to(root)
-                    if should_exclude(rel_path, exclude_patterns):
-                        logger.info("백업 제외: %s", rel_path)
-                        continue
-                    archive.write(file, arcname=rel_path.as_posix())
-        logger.info("백업 생성: %s", zip_path)
+        write_zip(zip_path, prepare_members_parallel(entries, codec, level, logger, workers, metrics))
+        index.add(zip_path)
+        logger.info(
+            "백업 생성: %s",
+            zip_path,
+            extra=event("backup_created", folder=folder_name, path=zip_path, files=len(entries)),
+        )
+
+        cleanup_old_backups(zip_dir, retention_days, logger, index)
+
+    if incremental and snapshots_changed:
+        collect_garbage(backup_root, logger, index)
+
 
-        cleanup_old_backups(zip_dir, retention_days, logger)
+def object_path(objects_dir: Path, digest: str, codec: str) -> Path:
+    return objects_dir / digest[:2] / (digest + OBJECT_SUFFIXES[codec])
 
 
-def cleanup_old_backups(folder: Path, retention_days: int, logger: logging.Logger) -> None:
+def find_object(objects_dir: Path, digest: str) -> Path | None:
+    for codec in OBJECT_SUFFIXES:
+        candidate = object_path(objects_dir, digest, codec)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def write_object(source: Path, objects_dir: Path, codec: str, level: int) -> Tuple[str, Path, bool]:
+    """파일을 한 번만 읽으면서 해시와 압축을 함께 수행하여 객체 저장소에 넣는다.
+
+    (SHA-256, 객체 경로, 새로 저장했는지 여부)를 반환한다. 같은 내용의 객체가 이미 있으면
+    새로 쓴 임시 파일은 버리고 기존 객체를 돌려준다.
+    """
+    objects_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=objects_dir, suffix=".tmp")
+    digest = sha256()
+    try:
+        with source.open("rb") as src, os.fdopen(fd, "wb") as dst:
+            chunk = src.read(HASH_BUFFER_SIZE)
+            codec = choose_codec(source, chunk, codec)
+            compressor = new_compressor(codec, level, raw_deflate=False)
+            while chunk:
+                digest.update(chunk)
+                dst.write(compressor.compress(chunk) if compressor else chunk)
+                chunk = src.read(HASH_BUFFER_SIZE)
+            if compressor:
+                dst.write(compressor.flush())
+        hexdigest = digest.hexdigest()
+        existing = find_object(objects_dir, hexdigest)
+        if existing is not None:
+            os.unlink(tmp_name)
+            return hexdigest, existing, False
+        target = object_path(objects_dir, hexdigest, codec)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_name, target)
+        return hexdigest, target, True
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+def load_latest_manifest(snapshots_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """가장 최근 스냅샷 매니페스트를 {상대 경로: 파일 정보} 형태로 읽는다."""
+    manifests = sorted(snapshots_dir.glob("*.json"))
+    if not manifests:
+        return {}
+    with manifests[-1].open("r", encoding="utf-8") as fh:
+        return {record["path"]: record for record in json.load(fh).get("files", [])}
+
+
+def backup_folder_incremental(
+    folder_name: str,
+    entries: Iterable[FileEntry],
+    backup_root: Path,
+    timestamp: str,
+    codec: str,
+    level: int,
+    logger: logging.Logger,
+    cache: HashCache | None = None,
+    workers: int | None = None,
+    index: FileIndex | None = None,
+    metrics: RunMetrics | None = None,
+) -> Path:
+    """직전 스냅샷과 비교하여 새로 생기거나 바뀐 파일만 객체 저장소에 넣고 매니페스트를 쓴다.
+
+    매니페스트에는 폴더의 모든 파일이 객체 참조로 기록되므로 각 스냅샷은 단독으로 복원할 수 있다.
+    """
+    snapshots_dir = backup_root / folder_name / "snapshots"
+    objects_dir = backup_root / OBJECTS_DIR_NAME
+    snapshots_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_latest_manifest(snapshots_dir)
+
+    records: List[Dict[str, Any]] = []
+    changed: List[FileEntry] = []
+    for entry in entries:
+        record = previous.get(entry.relative.as_posix())
+        if (
+            record
+            and record["size"] == entry.size
+            and record["mtime_ns"] == entry.mtime_ns
+            and (objects_dir / record["object"]).exists()
+        ):
+            records.append(record)
+        else:
+            changed.append(entry)
+
+    # 경로는 바뀌었지만 내용이 같은 파일(이동/복사)은 해시 캐시로 기존 객체를 찾아 참조만 추가
+    cached = cache.lookup(changed, "full") if cache is not None else {}
+    located: Dict[FileEntry, Tuple[str, Path]] = {}
+    for entry in changed:
+        digest = cached.get(entry)
+        obj = find_object(objects_dir, digest) if digest else None
+        if obj is not None:
+            located[entry] = (digest, obj)
+
+    # 저장소에 없는 내용만 워커 풀에서 병렬로 해시·압축하여 저장
+    to_write = [entry for entry in changed if entry not in located]
+    computed: Dict[FileEntry, str] = {}
+    stored = 0
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = [(entry, pool.submit(write_object, entry.path, objects_dir, codec, level)) for entry in to_write]
+        for entry, future in futures:
+            try:
+                digest, obj, created = future.result()
+            except OSError as exc:
+                # 색인 이후 삭제되었거나 읽을 수 없는 파일은 이번 스냅샷에서 빼고 계속 진행
+                logger.warning("백업 실패 (건너뜀): %s (%s)", entry.path, exc)
+                continue
+            located[entry] = (digest, obj)
+            computed[entry] = digest
+            stored += created
+            if created and index is not None:
+                index.add(obj)
+            if created and metrics is not None:
+                metrics.add("files_backed_up")
+                metrics.add("bytes_compressed", entry.size)
+                metrics.add("bytes_written", obj.stat().st_size)
+
+    for entry in changed:
+        if entry not in located:
+            continue
+        digest, obj = located[entry]
+        records.append(
+            {
+                "path": entry.relative.as_posix(),
+                "size": entry.size,
+                "mtime_ns": entry.mtime_ns,
+                "sha256": digest,
+                "object": obj.relative_to(objects_dir).as_posix(),
+            }
+        )
+    if cache is not None and computed:
+        cache.store(computed, "full")
+
+    manifest = {
+        "version": 1,
+        "folder": folder_name,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "objects": os.path.relpath(objects_dir, snapshots_dir).replace(os.sep, "/"),
+        "files": sorted(records, key=lambda record: record["path"]),
+    }
+    manifest_path = snapshots_dir / f"{Path(folder_name).name}_{timestamp}.json"
+    tmp_path = manifest_path.with_suffix(".json.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, manifest_path)
+    logger.info(
+        "증분 백업: 파일 %d개 중 변경 %d개, 새 객체 %d개 저장", len(records), len(changed), stored
+    )
+    return manifest_path
+
+
+def collect_garbage(backup_root: Path, logger: logging.Logger, index: FileIndex | None = None) -> int:
+    """어느 스냅샷에서도 참조하지 않는 객체와 남은 임시 파일을 지우고 삭제 수를 반환한다."""
+    objects_dir = backup_root / OBJECTS_DIR_NAME
+    if not objects_dir.exists():
+        return 0
+    referenced: Set[str] = set()
+    for manifest_path in backup_root.glob("**/snapshots/*.json"):
+        with manifest_path.open("r", encoding="utf-8") as fh:
+            referenced.update(record["object"] for record in json.load(fh).get("files", []))
+    removed = 0
+    for obj in objects_dir.rglob("*"):
+        if obj.is_file() and obj.relative_to(objects_dir).as_posix() not in referenced:
+            obj.unlink(missing_ok=True)
+            if index is not None:
+                index.remove(obj)
+            removed += 1
+    if removed:
+        logger.info("참조되지 않는 백업 객체 삭제: %d개", removed)
+    return removed
+
+
+def cleanup_old_backups(
+    folder: Path,
+    retention_days: int,
+    logger: logging.Logger,
+    index: FileIndex | None = None,
+    pattern: str = "*.zip",
+) -> int:
+    """보존 기간이 지난 백업을 지우고 삭제한 수를 반환한다.
+
+    가장 최근 백업은 기간이 지났어도 남겨 둔다. 데몬이 변경 없는 폴더의 백업을 건너뛰는 동안
+    보존 기간이 지나도 그 폴더의 유일한 백업(과 증분 객체)이 사라지지 않게 하기 위함이다.
+    """
     if retention_days <= 0:
-        return
+        return 0
     threshold = datetime.now() - timedelta(days=retention_days)
-    for zip_file in folder.glob("*.zip"):
-        modified = datetime.fromtimestamp(zip_file.stat().st_mtime)
+    backups = sorted((zip_file.stat().st_mtime, zip_file) for zip_file in folder.glob(pattern))
+    removed = 0
+    for mtime, zip_file in backups[:-1]:
+        modified = datetime.fromtimestamp(mtime)
         if modified < threshold:
             zip_file.unlink(missing_ok=True)
+            if index is not None:
+                index.remove(zip_file)
+            removed += 1
             logger.info("오래된 백업 삭제: %s", zip_file)
+    return removed
 
 
-def move_file(source: Path, destination: Path, logger: logging.Logger) -> None:
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(str(source), str(destination))
-    logger.info("파일 이동: %s -> %s", source, destination)
+OBJECT_DECOMPRESSORS: Dict[str, Callable[[], Any]] = {".z": zlib.decompressobj, ".bz2": bz2.BZ2Decompressor}
 
 
-def organize_files(root: Path, config: Dict[str, Any], logger: logging.Logger) -> None:
-    rules = config.get("file_organization", {}).get("rules", [])
-    if not rules:
-        return
-    logger.info("파일 정리 규칙 적용 (%d개)", len(rules))
+def safe_destination(destination: Path, relative: str) -> Path:
+    target = (destination / relative).resolve()
+    if destination.resolve() not in target.parents:
+        raise ValueError(f"복원 경로가 대상 폴더를 벗어납니다: {relative}")
+    return target
+
+
+def restore_snapshot(snapshot: Path, destination: Path, logger: logging.Logger, overwrite: bool = False) -> int:
+    """ZIP 백업 또는 증분 백업 매니페스트를 ``destination``에 복원하고 복원한 파일 수를 반환한다."""
+    destination.mkdir(parents=True, exist_ok=True)
+    restored = 0
+    if snapshot.suffix == ".zip":
+        with ZipFile(snapshot) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                target = safe_destination(destination, info.filename)
+                if target.exists() and not overwrite:
+                    logger.warning("이미 존재하여 건너뜀: %s", target)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with archive.open(info) as src, target.open("wb") as dst:
+                    shutil.copyfileobj(src, dst, HASH_BUFFER_SIZE)
+                restored += 1
+        return restored
+
+    with snapshot.open("r", encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    objects_dir = snapshot.parent / manifest.get("objects", f"../../{OBJECTS_DIR_NAME}")
+    for record in manifest.get("files", []):
+        target = safe_destination(destination, record["path"])
+        if target.exists() and not overwrite:
+            logger.warning("이미 존재하여 건너뜀: %s", target)
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        obj = objects_dir / record["object"]
+        decompressor = OBJECT_DECOMPRESSORS.get(obj.suffix, lambda: None)()
+        digest = sha256()
+        tmp_path = target.with_name(target.name + ".restore.tmp")
+        with obj.open("rb") as src, tmp_path.open("wb") as dst:
+            for chunk in iter(lambda: src.read(HASH_BUFFER_SIZE), b""):
+                data = decompressor.decompress(chunk) if decompressor else chunk
+                digest.update(data)
+                dst.write(data)
+            if hasattr(decompressor, "flush"):  # zlib만 남은 데이터를 flush로 내보냄
+                data = decompressor.flush()
+                digest.update(data)
+                dst.write(data)
+        if digest.hexdigest() != record["sha256"]:
+            tmp_path.unlink(missing_ok=True)
+            raise ValueError(f"백업 객체가 손상되었습니다: {obj}")
+        os.replace(tmp_path, target)
+        os.utime(target, ns=(record["mtime_ns"], record["mtime_ns"]))
+        restored += 1
+    return restored
+
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+class MovePlan:
+    """파일 이동 계획. 대상 경로 충돌을 미리 해소하여 기존 파일을 덮어쓰지 않도록 한다."""
+
+    def __init__(self, index: FileIndex) -> None:
+        self.index = index
+        self.moves: List[Tuple[FileEntry, Path]] = []
+        self._planned_sources: Set[Path] = set()
+        self._reserved: Set[Path] = set()
+
+    def __contains__(self, entry: FileEntry) -> bool:
+        return entry.path in self._planned_sources
+
+    def _is_taken(self, path: Path) -> bool:
+        return path in self._reserved or path in self.index.files or path.exists()
+
+    def add(self, entry: FileEntry, destination: Path) -> Path:
+        """이동을 계획에 추가하고, 이름이 겹치면 ``이름 (n).확장자``로 바꾼 최종 경로를 반환한다."""
+        target = destination
+        counter = 1
+        while self._is_taken(target):
+            target = destination.with_name(f"{destination.stem} ({counter}){destination.suffix}")
+            counter += 1
+        self.moves.append((entry, target))
+        self._planned_sources.add(entry.path)
+        self._reserved.add(target)
+        return target
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry.size for entry, _ in self.moves)
+
+    @property
+    def target_dirs(self) -> List[Path]:
+        return sorted({target.parent for _, target in self.moves})
+
+
+def execute_plan(
+    plan: MovePlan,
+    logger: logging.Logger,
+    dry_run: bool = False,
+    workers: int | None = None,
+    metrics: RunMetrics | None = None,
+) -> int:
+    """이동 계획을 실행하고 이동한 파일 수를 반환한다.
+
+    대상 폴더는 한 번씩만 만들고, 이동은 스레드 풀에서 동시에 수행한다. ``dry_run``이면
+    디스크는 건드리지 않고 계획만 출력하며 색인만 갱신하여 이후 단계의 계획에 반영한다.
+    """
+    if not plan.moves:
+        return 0
+    if dry_run:
+        for entry, target in plan.moves:
+            logger.info("[드라이런] 이동 예정: %s -> %s (%s)", entry.path, target, format_size(entry.size))
+            entry.origin = entry.disk_path
+            plan.index.move(entry.path, target)
+        logger.info("[드라이런] 이동 %d건, 예상 %s", len(plan.moves), format_size(plan.total_bytes))
+        return len(plan.moves)
+
+    for folder in plan.target_dirs:
+        folder.mkdir(parents=True, exist_ok=True)
+    moved = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(shutil.move, str(entry.path), str(target)): (entry.path, target)
+            for entry, target in plan.moves
+        }
+        for future in as_completed(futures):
+            source, target = futures[future]
+            try:
+                future.result()
+            except OSError as exc:
+                logger.warning("파일 이동 실패: %s -> %s (%s)", source, target, exc)
+                continue
+            plan.index.move(source, target)
+            moved += 1
+            logger.debug("파일 이동: %s -> %s", source, target, extra=event("file_moved", source=source, target=target))
+    if metrics is not None:
+        metrics.add("files_moved", moved)
+    logger.info("파일 이동 %d건 완료 (%s)", moved, format_size(plan.total_bytes))
+    return moved
+
 
+def plan_organization(
+    root: Path,
+    rules: List[Dict[str, Any]],
+    index: FileIndex,
+    logger: logging.Logger,
+    changed: Set[Path] | None = None,
+) -> MovePlan:
+    """색인 한 번 순회로 모든 규칙을 평가하여 이동 계획을 만든다. 파일마다 처음 일치한 규칙을 적용한다.
+
+    ``changed``가 주어지면 그 파일들만 모든 규칙으로 평가하고, 나머지 파일은 시간이 지나
+    새로 일치할 수 있는 ``older_than_days`` 규칙만 평가한다.
+    """
+    now = datetime.now()
+    compiled = []
     for rule in rules:
         pattern = rule.get("pattern")
         destination = rule.get("destination")
         if not pattern or not destination:
             logger.warning("유효하지 않은 정리 규칙: %s", rule)
             continue
-        dest_root = root / destination
         older_than_days = rule.get("older_than_days")
         cutoff = None
         if isinstance(older_than_days, (int, float)):
-            cutoff = datetime.now() - timedelta(days=older_than_days)
-        create_year_folders = rule.get("create_year_folders", False)
+            cutoff = now - timedelta(days=older_than_days)
+        compiled.append((pattern, root / destination, cutoff, rule.get("create_year_folders", False)))
+    timed = [rule for rule in compiled if rule[2] is not None]
 
-        for file in root.rglob(pattern):
-            if not file.is_file():
+    plan = MovePlan(index)
+    for entry in list(index.files.values()):
+        candidates = compiled if changed is None or entry.path in changed else timed
+        for pattern, dest_root, cutoff, create_year_folders in candidates:
+            if not entry.relative.match(pattern):
                 continue
-            if dest_root in file.parents:
+            if dest_root in entry.path.parents:
+                continue
+            if cutoff and entry.modified > cutoff:
                 continue
-            if cutoff:
-                modified = datetime.fromtimestamp(file.stat().st_mtime)
-                if modified > cutoff:
-                    continue
             target_dir = dest_root
             if create_year_folders:
-                year = datetime.fromtimestamp(file.stat().st_mtime).strftime("%Y")
-                target_dir = dest_root / year
-            destination_path = target_dir / file.name
-            move_file(file, destination_path, logger)
+                target_dir = dest_root / entry.modified.strftime("%Y")
+            plan.add(entry, target_dir / entry.path.name)
+            break
+    return plan
+
+
+def organize_files(
+    root: Path,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    index: FileIndex | None = None,
+    dry_run: bool = False,
+    changed: Set[Path] | None = None,
+    metrics: RunMetrics | None = None,
+) -> None:
+    rules = config.get("file_organization", {}).get("rules", [])
+    if not rules:
+        return
+    logger.info("파일 정리 규칙 적용 (%d개)", len(rules))
+    index = index or FileIndex.scan(root)
+    plan = plan_organization(root, rules, index, logger, changed)
+    execute_plan(plan, logger, dry_run, metrics=metrics)
+
+
+def hash_file(path: Path, buffer_size: int = HASH_BUFFER_SIZE) -> str:
+    digest = sha256()
+    # 큰 버퍼 하나를 재사용하여 대용량 파일도 적은 시스템 호출로 읽음
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as fh:
+        while True:
+            read = fh.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
 
 
-def hash_file(path: Path) -> str:
+def hash_file_edges(path: Path, size: int, edge_size: int = EDGE_HASH_BYTES) -> str:
+    """파일 앞/뒤 ``edge_size`` 바이트만 해시한다. 2 * edge_size 이하 파일은 전체 내용과 같다."""
     digest = sha256()
     with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
-            digest.update(chunk)
+        digest.update(fh.read(edge_size))
+        if size > edge_size:
+            fh.seek(max(edge_size, size - edge_size))
+            digest.update(fh.read(edge_size))
     return digest.hexdigest()
 
 
-def cleanup_workspace(root: Path, config: Dict[str, Any], logger: logging.Logger) -> None:
+def group_by_digest(
+    pool: ThreadPoolExecutor,
+    groups: List[List[FileEntry]],
+    digest_func: Callable[[FileEntry], str],
+    logger: logging.Logger,
+    cache: HashCache | None = None,
+    kind: str = "full",
+    metrics: RunMetrics | None = None,
+) -> List[List[FileEntry]]:
+    """각 그룹을 (크기, 다이제스트)로 다시 나누고 2개 이상 남은 그룹만 반환한다.
+
+    ``cache``가 있으면 캐시에 없는 파일만 ``digest_func``로 계산하고 결과를 캐시에 저장한다.
+    """
+
+    def safe_digest(entry: FileEntry) -> str | None:
+        try:
+            return digest_func(entry)
+        except OSError as exc:
+            logger.warning("해시 계산 실패: %s (%s)", entry.path, exc)
+            return None
+
+    entries = [entry for group in groups for entry in group]
+    digests = cache.lookup(entries, kind) if cache is not None else {}
+    missing = [entry for entry in entries if entry not in digests]
+    computed = {
+        entry: digest for entry, digest in zip(missing, pool.map(safe_digest, missing)) if digest is not None
+    }
+    if cache is not None and computed:
+        cache.store(computed, kind)
+    if metrics is not None:
+        edge_limit = 2 * EDGE_HASH_BYTES
+        metrics.add("bytes_hashed", sum(e.size if kind == "full" else min(e.size, edge_limit) for e in computed))
+    digests.update(computed)
+
+    buckets: Dict[Tuple[int, str], List[FileEntry]] = defaultdict(list)
+    for entry in entries:
+        if entry in digests:
+            buckets[(entry.size, digests[entry])].append(entry)
+    return [group for group in buckets.values() if len(group) > 1]
+
+
+def find_duplicates(
+    entries: Iterable[FileEntry],
+    logger: logging.Logger,
+    workers: int | None = None,
+    cache: HashCache | None = None,
+    metrics: RunMetrics | None = None,
+) -> List[Tuple[FileEntry, FileEntry]]:
+    """내용이 같은 파일을 찾아 (중복 파일, 남겨 둘 원본) 목록을 반환한다.
+
+    1) 크기가 유일한 파일은 중복일 수 없으므로 제외하고, 2) 앞/뒤 일부 해시로 후보를
+    줄인 뒤, 3) 남은 후보만 전체 SHA-256을 계산한다. 해시는 스레드 풀에서 병렬로 읽으며,
+    ``cache``가 있으면 변경되지 않은 파일은 다시 읽지 않는다.
+    그룹마다 상대 경로가 가장 앞서는 파일을 원본으로 남긴다.
+    """
+    by_size: Dict[int, List[FileEntry]] = defaultdict(list)
+    for entry in entries:
+        by_size[entry.size].append(entry)
+    candidates = [group for group in by_size.values() if len(group) > 1]
+    if not candidates:
+        return []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        groups = group_by_digest(
+            pool, candidates, lambda e: hash_file_edges(e.disk_path, e.size), logger, cache, "edge", metrics
+        )
+        # 앞/뒤 해시가 파일 전체를 덮는 작은 파일은 이미 내용이 확인됨
+        confirmed = [group for group in groups if group[0].size <= 2 * EDGE_HASH_BYTES]
+        pending = [group for group in groups if group[0].size > 2 * EDGE_HASH_BYTES]
+        confirmed += group_by_digest(
+            pool, pending, lambda e: hash_file(e.disk_path), logger, cache, "full", metrics
+        )
+
+    duplicates: List[Tuple[FileEntry, FileEntry]] = []
+    for group in confirmed:
+        original, *others = sorted(group, key=lambda entry: entry.relative)
+        duplicates.extend((entry, original) for entry in others)
+    return duplicates
+
+
+def cleanup_workspace(
+    root: Path,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    index: FileIndex | None = None,
+    cache: HashCache | None = None,
+    dry_run: bool = False,
+    changed: Set[Path] | None = None,
+    metrics: RunMetrics | None = None,
+) -> None:
+    """``changed``가 주어지면 바뀐 파일과 크기가 같은 파일만 중복 검사한다."""
     rules = config.get("cleanup", {})
     if not rules:
         return
     quarantine_root = root / "quarantine"
     duplicates_dir = quarantine_root / "duplicates"
     expired_dir = quarantine_root / "expired"
-    duplicates_dir.mkdir(parents=True, exist_ok=True)
-    expired_dir.mkdir(parents=True, exist_ok=True)
+    if not dry_run:
+        duplicates_dir.mkdir(parents=True, exist_ok=True)
+        expired_dir.mkdir(parents=True, exist_ok=True)
+    index = index or FileIndex.scan(root)
 
+    # 중복 파일과 오래된 파일을 하나의 계획으로 모아 한 번에 실행 (중복으로 옮길 파일은 만료 대상에서 제외)
+    plan = MovePlan(index)
+    candidates = index.iter_files(exclude_parts=WORKSPACE_EXCLUDED_PARTS)
     if rules.get("remove_duplicates"):
         logger.info("중복 파일 정리 수행")
-        seen: Dict[str, Path] = {}
-        for file in root.rglob("*"):
-            if file.is_file() and "backups" not in file.parts and "quarantine" not in file.parts:
-                digest = hash_file(file)
-                if digest in seen:
-                    target = duplicates_dir / file.name
-                    move_file(file, target, logger)
-                else:
-                    seen[digest] = file
+        suspects = candidates
+        if changed is not None:
+            # 바뀌지 않은 파일끼리는 이전 실행에서 이미 정리되었으므로 바뀐 파일과 크기가 같은 파일만 비교
+            sizes = {entry.size for entry in candidates if entry.path in changed}
+            suspects = [entry for entry in candidates if entry.size in sizes]
+        for duplicate, _ in find_duplicates(suspects, logger, rules.get("hash_workers"), cache, metrics):
+            plan.add(duplicate, duplicates_dir / duplicate.path.name)
 
     max_age = rules.get("max_file_age_days")
     if isinstance(max_age, (int, float)) and max_age > 0:
         cutoff = datetime.now() - timedelta(days=max_age)
         logger.info("오래된 파일 정리 (기준: %s 이전)", cutoff.date())
-        for file in root.rglob("*"):
-            if file.is_file() and "backups" not in file.parts and "quarantine" not in file.parts:
-                modified = datetime.fromtimestamp(file.stat().st_mtime)
-                if modified < cutoff:
-                    target = expired_dir / file.relative_to(root)
-                    move_file(file, target, logger)
+        for entry in candidates:
+            if entry not in plan and entry.modified < cutoff:
+                plan.add(entry, expired_dir / entry.relative)
+
+    execute_plan(plan, logger, dry_run, metrics=metrics)
 
     if rules.get("delete_empty_folders"):
         logger.info("빈 폴더 삭제")
-        for folder in sorted((p for p in root.rglob("*") if p.is_dir()), reverse=True):
-            if folder in (duplicates_dir, expired_dir):
+        protected = (duplicates_dir, expired_dir)
+        # 색인에 남아 있는 파일과 격리 폴더의 상위 폴더는 비어 있지 않은 것으로 간주
+        occupied: Set[Path] = set()
+        for path in [*index.files, *protected]:
+            occupied.update(path.parents)
+        deleted = 0
+        for folder in sorted(index.dirs, reverse=True):
+            if folder in occupied or folder in protected:
+                occupied.add(folder.parent)
                 continue
-            if not any(folder.iterdir()):
+            if dry_run:
+                logger.info("[드라이런] 빈 폴더 삭제 예정: %s", folder)
+                continue
+            try:
                 folder.rmdir()
-                logger.info("빈 폴더 삭제: %s", folder)
+            except OSError:
+                # 색인 이후에 생긴 파일 등으로 실제로는 비어 있지 않은 경우
+                occupied.add(folder.parent)
+                continue
+            index.remove_dir(folder)
+            deleted += 1
+            logger.debug("빈 폴더 삭제: %s", folder, extra=event("folder_deleted", path=folder))
+        if deleted:
+            logger.info("빈 폴더 %d개 삭제", deleted)
+        if metrics is not None:
+            metrics.add("folders_deleted", deleted)
+
+
+def logging_options(config: Dict[str, Any], log_level: str | None = None) -> Dict[str, Any]:
+    """설정 파일의 ``logging`` 섹션에 명령행 ``--log-level``을 덮어쓴 로그 옵션을 만든다."""
+    options = dict(config.get("logging", {}))
+    if log_level is not None:
+        options["level"] = log_level
+    level_name = str(options.get("level", "info")).lower()
+    if level_name not in LOG_LEVELS:
+        raise ValueError(f"알 수 없는 로그 레벨: {level_name} (사용 가능: {', '.join(LOG_LEVELS)})")
+    return options
+
+
+def metrics_path(root: Path, options: Dict[str, Any], override: str | None = None) -> Path | None:
+    """Prometheus 텍스트 파일 경로. 빈 문자열이나 null이면 기록하지 않는다. 상대 경로는 루트 기준."""
+    value = override if override is not None else options.get("metrics_file", DEFAULT_METRICS_FILE)
+    if not value:
+        return None
+    path = Path(value).expanduser()
+    return path if path.is_absolute() else root / path
 
 
-def run_automation(root: Path, config_path: Path) -> None:
+def run_stages(
+    root: Path,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    index: FileIndex,
+    cache: HashCache | None,
+    dry_run: bool = False,
+    changed: Set[Path] | None = None,
+    metrics: RunMetrics | None = None,
+) -> None:
+    """백업 → 정리 → 격리 단계를 차례로 수행한다. ``changed``가 주어지면 바뀐 파일만 처리한다."""
+    metrics = metrics or RunMetrics()
+    with metrics.stage("backup"):
+        backup_folders(root, config, logger, index, cache, dry_run, changed, metrics)
+    with metrics.stage("organize"):
+        organize_files(root, config, logger, index, dry_run, changed, metrics)
+    with metrics.stage("cleanup"):
+        cleanup_workspace(root, config, logger, index, cache, dry_run, changed, metrics)
+    if cache is not None:
+        pruned = cache.prune(index.files.values())
+        logger.info("해시 캐시: 적중 %d건, 계산 %d건, 오래된 항목 %d건 삭제", cache.hits, cache.misses, pruned)
+        metrics.add("hash_cache_hits", cache.hits)
+        metrics.add("hash_cache_misses", cache.misses)
+        cache.hits = cache.misses = 0
+
+
+def run_automation(
+    root: Path,
+    config_path: Path,
+    use_hash_cache: bool = True,
+    dry_run: bool = False,
+    log_level: str | None = None,
+    metrics_file: str | None = None,
+) -> None:
     config = load_config(config_path)
+    options = logging_options(config, log_level)
+    log_dir = root / "logs"
+    # 드라이런은 로그 파일과 해시 캐시도 쓰지 않아 디스크를 전혀 변경하지 않음
+    logger = setup_logger(None if dry_run else log_dir, options)
+    logger.info("자동화 시작 - 루트: %s%s", root, " (드라이런)" if dry_run else "")
+
+    metrics = RunMetrics()
+    cache = None
+    try:
+        with metrics.stage("scan"):
+            index = FileIndex.scan(root)
+        metrics.add("files_scanned", len(index.files))
+        logger.info("파일 색인 완료 (파일 %d개, 폴더 %d개)", len(index.files), len(index.dirs))
+        cache = HashCache(root / STATE_DIR_NAME / "hash_cache.sqlite3") if use_hash_cache and not dry_run else None
+        run_stages(root, config, logger, index, cache, dry_run, metrics=metrics)
+        metrics.finish()
+        metrics.log_summary(logger)
+        prom_path = None if dry_run else metrics_path(root, options, metrics_file)
+        if prom_path is not None:
+            metrics.write_prometheus(prom_path, root)
+        logger.info("자동화 완료")
+    finally:
+        if cache is not None:
+            cache.close()
+        close_logger()
+
+
+SCHEDULE_INTERVALS = {"hourly": 3600, "daily": 24 * 3600, "weekly": 7 * 24 * 3600}
+SCHEDULE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 24 * 3600}
+
+
+def parse_schedule(value: Any) -> float:
+    """``backup_rules.schedule``을 실행 간격(초)으로 바꾼다.
+
+    ``"hourly"``/``"daily"``/``"weekly"``, ``"30m"``·``"6h"``처럼 숫자와 단위(s/m/h/d),
+    또는 초 단위 숫자를 허용한다. 값이 없으면 매일 실행한다.
+    """
+    if value is None:
+        return SCHEDULE_INTERVALS["daily"]
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        seconds = float(value)
+    elif isinstance(value, str):
+        text = value.strip().lower()
+        if text in SCHEDULE_INTERVALS:
+            return SCHEDULE_INTERVALS[text]
+        unit = SCHEDULE_UNITS.get(text[-1:])
+        try:
+            seconds = float(text[:-1]) * unit if unit else float(text)
+        except ValueError:
+            raise ValueError(f"알 수 없는 schedule 값: {value!r}") from None
+    else:
+        raise ValueError(f"알 수 없는 schedule 값: {value!r}")
+    if seconds <= 0:
+        raise ValueError(f"schedule 간격은 0보다 커야 합니다: {value!r}")
+    return seconds
+
+
+class ScanTracker:
+    """inotify를 쓸 수 없을 때의 대체 구현. 실행할 때마다 루트 전체를 다시 스캔해 색인과 비교한다."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def sync(self, dirs: Iterable[Path]) -> None:
+        pass
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(timeout)
+
+    def collect(self) -> Set[Path] | None:
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyTracker:
+    """Linux inotify(ctypes)로 루트 아래 모든 폴더를 감시하며 바뀐 경로를 모은다.
+
+    inotify는 재귀 감시를 지원하지 않으므로 색인의 폴더마다 감시를 걸고, 새로 생긴 폴더는
+    ``sync``에서 추가한다. 큐가 넘치면(``IN_Q_OVERFLOW``) 다음 실행에서 전체를 다시 스캔한다.
+    열어 둔 채 계속 쓰는 파일(로그 등)은 닫히거나 속성이 바뀔 때 반영된다.
+    """
+
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    MASK = (
+        IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+        | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    )
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, root: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify는 Linux에서만 사용할 수 있습니다.")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.root = root
+        self._state_dir = root / STATE_DIR_NAME
+        self._paths: Dict[int, Path] = {}
+        self._watched: Dict[Path, int] = {}
+        self._dirty: Set[Path] = set()
+        self._overflow = False
+        try:
+            self._watch(root)
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def _watch(self, folder: Path) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(folder), self.MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(folder))
+        # 폴더가 이동한 뒤 다시 감시를 걸면 같은 wd가 돌아오므로 경로만 갱신
+        stale = self._paths.get(wd)
+        if stale is not None and self._watched.get(stale) == wd:
+            del self._watched[stale]
+        self._paths[wd] = folder
+        self._watched[folder] = wd
+
+    def sync(self, dirs: Iterable[Path]) -> None:
+        """색인에 있지만 아직 감시하지 않는 폴더에 감시를 추가한다."""
+        for folder in dirs:
+            if folder in self._watched:
+                continue
+            try:
+                self._watch(folder)
+            except OSError as exc:
+                if exc.errno == 28:  # ENOSPC: max_user_watches 한도 초과
+                    self._overflow = True
+                    return
+                # 그 사이 삭제된 폴더는 다음 이벤트에서 처리됨
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                buffer = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = self.EVENT_HEADER.unpack_from(buffer, offset)
+                offset += self.EVENT_HEADER.size
+                name = buffer[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & self.IN_Q_OVERFLOW:
+                    self._overflow = True
+                    continue
+                folder = self._paths.get(wd)
+                if folder is None:
+                    continue
+                if mask & self.IN_IGNORED:
+                    del self._paths[wd]
+                    if self._watched.get(folder) == wd:
+                        del self._watched[folder]
+                    continue
+                path = folder / os.fsdecode(name) if name else folder
+                if path == self._state_dir or self._state_dir in path.parents:
+                    continue
+                if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF) and path != self.root:
+                    # 이동한 폴더의 새 위치는 IN_MOVED_TO로 따로 보고되므로 기존 경로를 비움
+                    self._watched.pop(path, None)
+                self._dirty.add(path)
+
+    def wait(self, timeout: float) -> None:
+        """최대 ``timeout``초 동안 이벤트를 받아 바뀐 경로를 모은다."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if ready:
+                self._drain()
+
+    def collect(self) -> Set[Path] | None:
+        """모은 경로를 반환하고 비운다. 이벤트가 유실되었으면 None (전체 재스캔 필요)."""
+        self._drain()
+        dirty, overflow = self._dirty, self._overflow
+        self._dirty, self._overflow = set(), False
+        return None if overflow else dirty
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def create_tracker(root: Path, force_polling: bool = False) -> ScanTracker | InotifyTracker:
+    if not force_polling:
+        try:
+            return InotifyTracker(root)
+        except (OSError, AttributeError):
+            # inotify를 쓸 수 없는 환경(Windows/macOS 등)은 매 실행 전체 스캔으로 대체
+            pass
+    return ScanTracker(root)
+
+
+def run_daemon(
+    root: Path,
+    config_path: Path,
+    use_hash_cache: bool = True,
+    force_polling: bool = False,
+    max_cycles: int | None = None,
+    log_level: str | None = None,
+    metrics_file: str | None = None,
+) -> None:
+    """``backup_rules.schedule`` 간격으로 자동화를 반복 실행한다 (Ctrl+C로 종료).
+
+    첫 실행은 전체를 처리하고, 이후에는 실행 사이에 inotify로 모은 바뀐 경로만 색인에
+    반영하여 그 파일들만 백업·정리·중복 검사한다. 설정 파일은 실행마다 다시 읽는다
+    (로그 설정은 시작할 때만 적용). 로그 파일은 날짜가 바뀌면 새 파일로 넘어가며, 실행
+    통계는 실행마다 Prometheus 파일을 갱신한다.
+    """
+    options = logging_options(load_config(config_path), log_level)
     log_dir = root / "logs"
-    logger = setup_logger(log_dir)
-    logger.info("자동화 시작 - 루트: %s", root)
+    log_day = datetime.now().date()
+    logger = setup_logger(log_dir, options)
+    # 첫 스캔 중의 변경도 놓치지 않도록 감시를 먼저 시작
+    tracker = create_tracker(root, force_polling)
+    logger.info("데몬 시작 - 루트: %s (변경 감지: %s)", root, "inotify" if isinstance(tracker, InotifyTracker) else "전체 스캔")
+    metrics = RunMetrics()
+    with metrics.stage("scan"):
+        index = FileIndex.scan(root)
+        tracker.sync(index.dirs)
+    metrics.add("files_scanned", len(index.files))
+    logger.info("파일 색인 완료 (파일 %d개, 폴더 %d개)", len(index.files), len(index.dirs))
+    cache = HashCache(root / STATE_DIR_NAME / "hash_cache.sqlite3") if use_hash_cache else None
+
+    changed: Set[Path] | None = None
+    force_full = False
+    cycle = 0
+    try:
+        while True:
+            today = datetime.now().date()
+            if today != log_day:
+                # 날짜가 바뀌면 새 날짜의 로그 파일로 다시 열고, 닫힌 이전 로그의 변경은 색인에 흡수
+                previous_logs = log_file_paths(log_dir, log_day)
+                logger = setup_logger(log_dir, options)
+                log_day = today
+                index.refresh(previous_logs)
+            config = load_config(config_path)
+            interval = parse_schedule(config.get("backup_rules", {}).get("schedule"))
+            cycle += 1
+            started = time.monotonic()
+            if changed is None:
+                logger.info("실행 #%d 시작 (전체)", cycle)
+            else:
+                logger.info("실행 #%d 시작 (변경된 파일 %d개)", cycle, len(changed))
+            try:
+                run_stages(root, config, logger, index, cache, changed=changed, metrics=metrics)
+            except Exception:
+                # 한 번의 실패로 데몬이 멈추지 않도록 기록만 하고 다음 일정에서 전체를 다시 처리
+                logger.exception("실행 #%d 실패", cycle)
+                index = FileIndex.scan(root)
+                force_full = True
+            tracker.sync(index.dirs)
+            metrics.finish()
+            metrics.log_summary(logger)
+            prom_path = metrics_path(root, options, metrics_file)
+            if prom_path is not None:
+                try:
+                    metrics.write_prometheus(prom_path, root)
+                except OSError as exc:
+                    logger.warning("실행 통계 기록 실패: %s (%s)", prom_path, exc)
+                else:
+                    # 도구가 직접 쓴 파일이 다음 실행의 변경으로 잡히지 않도록 색인에 반영
+                    if root in prom_path.parents:
+                        index.add(prom_path)
+            logger.info("실행 #%d 완료 (%.1f초)", cycle, time.monotonic() - started)
+            if max_cycles is not None and cycle >= max_cycles:
+                break
+
+            next_run = datetime.now() + timedelta(seconds=interval)
+            logger.info("다음 실행: %s", next_run.strftime("%Y-%m-%d %H:%M:%S"))
+            flush_logger()
+            tracker.wait(interval)
+            metrics = RunMetrics()
+            with metrics.stage("scan"):
+                paths = tracker.collect()
+                if paths is None:
+                    changed = index.refresh([root])
+                else:
+                    changed = index.refresh(sorted(paths))
+                tracker.sync(index.dirs)
+            # 데몬이 계속 쓰고 있는 오늘 로그 파일은 사용자 변경이 아님
+            changed.difference_update(log_file_paths(log_dir, log_day))
+            if force_full:
+                # 실패한 실행에서 처리하지 못한 변경은 새 색인에 이미 흡수되었으므로 전체를 다시 처리
+                changed = None
+                force_full = False
+            metrics.add("files_scanned", len(index.files) if changed is None else len(changed))
+    except KeyboardInterrupt:
+        logger.info("데몬 종료")
+    finally:
+        if cache is not None:
+            cache.close()
+        tracker.close()
+        close_logger()
 
-    backup_folders(root, config, logger)
-    organize_files(root, config, logger)
-    cleanup_workspace(root, config, logger)
 
-    logger.info("자동화 완료")
+SUBCOMMANDS = ("run", "daemon", "restore")
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="파일 백업 및 정리 자동화 도구")
-    parser.add_argument("root", help="작업 대상 루트 폴더")
-    parser.add_argument(
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="백업·정리·청소 실행 (기본 명령)")
+    run_parser.add_argument("root", help="작업 대상 루트 폴더")
+    run_parser.add_argument(
+        "-c",
+        "--config",
+        default="automation_config.json",
+        help="설정 파일 경로 (기본값: automation_config.json)",
+    )
+    run_parser.add_argument(
+        "--no-hash-cache",
+        dest="use_hash_cache",
+        action="store_false",
+        help=f"{STATE_DIR_NAME}/hash_cache.sqlite3 해시 캐시를 사용하지 않음",
+    )
+    run_parser.add_argument(
+        "-n",
+        "--dry-run",
+        action="store_true",
+        help="디스크를 변경하지 않고 백업·이동·삭제 계획과 예상 용량만 출력",
+    )
+    run_parser.add_argument(
+        "--log-level",
+        choices=list(LOG_LEVELS),
+        default=None,
+        help="로그 상세도 (설정 파일의 logging.level보다 우선, 기본값: info)",
+    )
+    run_parser.add_argument(
+        "--metrics",
+        default=None,
+        metavar="PATH",
+        help=f"실행 통계를 기록할 Prometheus 텍스트 파일 (기본값: 루트/{DEFAULT_METRICS_FILE})",
+    )
+
+    daemon_parser = subparsers.add_parser("daemon", help="schedule 간격으로 바뀐 파일만 반복 처리")
+    daemon_parser.add_argument("root", help="작업 대상 루트 폴더")
+    daemon_parser.add_argument(
         "-c",
         "--config",
         default="automation_config.json",
         help="설정 파일 경로 (기본값: automation_config.json)",
     )
-    return parser.parse_args()
+    daemon_parser.add_argument(
+        "--no-hash-cache",
+        dest="use_hash_cache",
+        action="store_false",
+        help=f"{STATE_DIR_NAME}/hash_cache.sqlite3 해시 캐시를 사용하지 않음",
+    )
+    daemon_parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="inotify 대신 실행마다 전체를 스캔하여 변경을 찾음",
+    )
+    daemon_parser.add_argument(
+        "--cycles",
+        type=int,
+        default=None,
+        metavar="N",
+        help="N번 실행한 뒤 종료 (기본값: 종료하지 않음)",
+    )
+    daemon_parser.add_argument(
+        "--log-level",
+        choices=list(LOG_LEVELS),
+        default=None,
+        help="로그 상세도 (설정 파일의 logging.level보다 우선, 기본값: info)",
+    )
+    daemon_parser.add_argument(
+        "--metrics",
+        default=None,
+        metavar="PATH",
+        help=f"실행 통계를 기록할 Prometheus 텍스트 파일 (기본값: 루트/{DEFAULT_METRICS_FILE})",
+    )
+
+    restore_parser = subparsers.add_parser("restore", help="백업 ZIP 또는 증분 스냅샷 복원")
+    restore_parser.add_argument("snapshot", help="복원할 백업 ZIP 또는 스냅샷 매니페스트(.json) 경로")
+    restore_parser.add_argument("destination", help="복원할 폴더")
+    restore_parser.add_argument("--overwrite", action="store_true", help="이미 있는 파일을 덮어씀")
+
+    # 하위 명령 없이 루트만 주는 기존 사용법은 run으로 처리
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] not in (*SUBCOMMANDS, "-h", "--help"):
+        argv.insert(0, "run")
+    return parser.parse_args(argv)
 
 
 def main() -> None:
     args = parse_args()
+    if args.command == "restore":
+        snapshot = Path(args.snapshot).expanduser().resolve()
+        if not snapshot.exists():
+            raise SystemExit(f"백업 파일을 찾을 수 없습니다: {snapshot}")
+        logger = setup_logger(None)
+        destination = Path(args.destination).expanduser().resolve()
+        try:
+            restored = restore_snapshot(snapshot, destination, logger, args.overwrite)
+            logger.info("복원 완료: 파일 %d개 -> %s", restored, destination)
+        except (ValueError, OSError) as exc:
+            raise SystemExit(str(exc)) from exc
+        finally:
+            close_logger()
+        return
+
     root = Path(args.root).expanduser().resolve()
     config_path = Path(args.config).expanduser().resolve()
     if not root.exists():
         raise SystemExit(f"지정한 루트 폴더가 없습니다: {root}")
     if not config_path.exists():
         raise SystemExit(f"설정 파일을 찾을 수 없습니다: {config_path}")
-    run_automation(root, config_path)
+    config = load_config(config_path)
+    try:
+        logging_options(config, args.log_level)
+        parse_compression(config.get("backup_rules", {}).get("compression", True))
+        if args.command == "daemon":
+            parse_schedule(config.get("backup_rules", {}).get("schedule"))
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    if args.command == "daemon":
+        run_daemon(root, config_path, args.use_hash_cache, args.poll, args.cycles, args.log_level, args.metrics)
+        return
+    run_automation(root, config_path, args.use_hash_cache, args.dry_run, args.log_level, args.metrics)
 
 
 if __name__ == "__main__":